@@ -0,0 +1,85 @@
+"""analytics aggregates
+
+Revision ID: 0001_analytics_aggregates
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_analytics_aggregates'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ingested_tournaments',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('player_count', sa.Integer(), nullable=False),
+        sa.Column('ingested_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'format_daily_totals',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('deck_count', sa.Integer(), nullable=False),
+        sa.Column('decklist_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'format')
+    )
+    op.create_table(
+        'archetype_daily_shares',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('archetype', sa.String(), nullable=False),
+        sa.Column('deck_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'format', 'archetype')
+    )
+    op.create_table(
+        'card_usage_aggregates',
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('card_key', sa.String(), nullable=False),
+        sa.Column('card_name', sa.String(), nullable=False),
+        sa.Column('decks_including', sa.Integer(), nullable=False),
+        sa.Column('total_copies', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('format', 'card_key')
+    )
+    op.create_table(
+        'card_price_snapshots',
+        sa.Column('card_id', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('set_id', sa.String(), nullable=False),
+        sa.Column('market_price', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('card_id', 'day')
+    )
+    op.create_index(
+        op.f('ix_card_price_snapshots_set_id'), 'card_price_snapshots', ['set_id'], unique=False
+    )
+    op.create_table(
+        'set_price_indices',
+        sa.Column('set_id', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('card_count', sa.Integer(), nullable=False),
+        sa.Column('market_price_sum', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('set_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('set_price_indices')
+    op.drop_index(op.f('ix_card_price_snapshots_set_id'), table_name='card_price_snapshots')
+    op.drop_table('card_price_snapshots')
+    op.drop_table('card_usage_aggregates')
+    op.drop_table('archetype_daily_shares')
+    op.drop_table('format_daily_totals')
+    op.drop_table('ingested_tournaments')
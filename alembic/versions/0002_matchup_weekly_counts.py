@@ -0,0 +1,36 @@
+"""matchup weekly counts
+
+Revision ID: 0002_matchup_weekly_counts
+Revises: 0001_analytics_aggregates
+Create Date: 2026-10-19 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_matchup_weekly_counts'
+down_revision: Union[str, None] = '0001_analytics_aggregates'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'matchup_weekly_counts',
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('archetype', sa.String(), nullable=False),
+        sa.Column('opponent', sa.String(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('ties', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('week_start', 'format', 'archetype', 'opponent')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('matchup_weekly_counts')
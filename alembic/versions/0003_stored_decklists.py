@@ -0,0 +1,45 @@
+"""stored decklists
+
+Revision ID: 0003_stored_decklists
+Revises: 0002_matchup_weekly_counts
+Create Date: 2026-10-19 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_stored_decklists'
+down_revision: Union[str, None] = '0002_matchup_weekly_counts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stored_decklists',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('tournament_id', sa.String(), nullable=False),
+        sa.Column('player_id', sa.String(), nullable=False),
+        sa.Column('format', sa.String(), nullable=False),
+        sa.Column('regulation_mark', sa.String(), nullable=True),
+        sa.Column('archetype', sa.String(), nullable=True),
+        sa.Column('placing', sa.Integer(), nullable=True),
+        sa.Column('cards', sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_stored_decklists_partition', 'stored_decklists', ['format', 'regulation_mark'], unique=False
+    )
+    op.create_index(
+        op.f('ix_stored_decklists_tournament_id'), 'stored_decklists', ['tournament_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stored_decklists_tournament_id'), table_name='stored_decklists')
+    op.drop_index('ix_stored_decklists_partition', table_name='stored_decklists')
+    op.drop_table('stored_decklists')
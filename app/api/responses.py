@@ -0,0 +1,70 @@
+# api/responses.py
+# Similar to a custom OutputFormatter in ASP.NET Core
+# Response classes and payload caching for high-throughput card list endpoints
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+from fastapi import Response
+from pydantic import TypeAdapter
+from app.models.card import Card
+
+
+class CardListResponse(Response):
+    """
+    JSON response for lists of cards, serialized directly by pydantic-core.
+
+    FastAPI's default path runs every nested Card model through
+    jsonable_encoder before handing the result to json.dumps. Dumping the
+    whole list with a TypeAdapter skips that intermediate dict tree and
+    produces the response body as bytes in a single call.
+    """
+    media_type = "application/json"
+    _adapter = TypeAdapter(List[Card])
+
+    @classmethod
+    def serialize(cls, cards: List[Card]) -> bytes:
+        """Serialize a list of cards to JSON bytes."""
+        return cls._adapter.dump_json(cards)
+
+    def render(self, content: Any) -> bytes:
+        # Pre-serialized payloads (e.g. from PayloadCache) are sent as-is
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        return self.serialize(content)
+
+
+class PayloadCache:
+    """
+    Small LRU cache of pre-serialized response bodies with a time-to-live.
+    Hot list payloads are stored as bytes so repeated requests skip both the
+    upstream API call and serialization.
+    """
+    def __init__(self, ttl_seconds: int, max_entries: int = 256):
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[datetime, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached payload for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if datetime.now() - stored_at >= self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: bytes) -> None:
+        """Store a payload, evicting the least recently used entry if full."""
+        self._entries[key] = (datetime.now(), payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
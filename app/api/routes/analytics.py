@@ -0,0 +1,50 @@
+# routes/analytics.py
+# Similar to AnalyticsController.cs in ASP.NET Core
+# Defines API routes for meta-share, card usage and price index analytics.
+# Every read endpoint is served from the materialized aggregate tables.
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Optional
+from datetime import date
+from app.services.analytics_service import AnalyticsService
+from app.services.card_service import CardService
+import logging
+
+router = APIRouter()
+
+@router.get("/meta-share/{format}")
+def get_meta_share(
+    format: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    service: AnalyticsService = Depends(AnalyticsService)
+) -> List[Dict[str, Any]]:
+    return service.get_meta_share(format, start_date, end_date)
+
+@router.get("/card-usage/{format}")
+def get_card_usage(
+    format: str,
+    limit: int = Query(50, ge=1, le=1000),
+    service: AnalyticsService = Depends(AnalyticsService)
+) -> List[Dict[str, Any]]:
+    return service.get_card_usage(format, limit)
+
+@router.get("/price-index/{set_id}")
+def get_price_index(
+    set_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    service: AnalyticsService = Depends(AnalyticsService)
+) -> List[Dict[str, Any]]:
+    return service.get_price_index(set_id, start_date, end_date)
+
+@router.post("/price-snapshots/{set_id}")
+async def ingest_price_snapshot(
+    set_id: str,
+    card_service: CardService = Depends(CardService),
+    service: AnalyticsService = Depends(AnalyticsService)
+) -> Dict[str, Any]:
+    logging.debug(f'Recording price snapshot for set: {set_id}')
+    cards = await card_service.get_cards_by_set(set_id)
+    # The upserts are blocking database work; keep them off the event loop
+    return await run_in_threadpool(service.ingest_price_snapshot, cards)
@@ -1,14 +1,92 @@
 # routes/cards.py
 # Similar to CardsController.cs in ASP.NET Core
 # Defines API routes and handlers for card-related operations
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
+from datetime import date
 from app.services.card_service import CardService
+from app.services.legality_service import LegalityService
 from app.models.card import Card
+from app.models.deck import LegalityCheckRequest, LegalityCheck, RotationImpact
+from app.api.responses import CardListResponse, PayloadCache
+from app.core.config import settings
 import logging
 from pokemontcgsdk.restclient import PokemonTcgException
 
 router = APIRouter()
 
+# Pre-serialized list payloads shared across requests
+card_payload_cache = PayloadCache(
+    ttl_seconds=settings.CACHE_TTL,
+    max_entries=settings.PAYLOAD_CACHE_MAX_ENTRIES
+)
+
+@router.get("/search", response_model=List[Card], response_class=CardListResponse)
+async def search_cards(
+    name: Optional[str] = None,
+    type: Optional[str] = None,
+    supertype: Optional[str] = None,
+    rarity: Optional[str] = None,
+    set_name: Optional[str] = None,
+    standard_legal: bool = True,
+    service: CardService = Depends(CardService)
+) -> CardListResponse:
+    cache_key = f"search:{name}:{type}:{supertype}:{rarity}:{set_name}:{standard_legal}"
+    payload = card_payload_cache.get(cache_key)
+    if payload is None:
+        logging.debug(f'Searching cards: {cache_key}')
+        cards = await service.search_cards(
+            name=name,
+            type=type,
+            supertype=supertype,
+            rarity=rarity,
+            set_name=set_name,
+            standard_legal=standard_legal
+        )
+        payload = CardListResponse.serialize(cards)
+        card_payload_cache.set(cache_key, payload)
+    return CardListResponse(content=payload)
+
+@router.get("/set/{set_id}", response_model=List[Card], response_class=CardListResponse)
+async def get_cards_by_set(
+    set_id: str,
+    service: CardService = Depends(CardService)
+) -> CardListResponse:
+    cache_key = f"set:{set_id}"
+    payload = card_payload_cache.get(cache_key)
+    if payload is None:
+        logging.debug(f'Getting cards for set: {set_id}')
+        cards = await service.get_cards_by_set(set_id)
+        payload = CardListResponse.serialize(cards)
+        card_payload_cache.set(cache_key, payload)
+    return CardListResponse(content=payload)
+
+@router.post("/legality/check", response_model=LegalityCheck)
+async def check_decklist_legality(
+    request: LegalityCheckRequest,
+    service: CardService = Depends(CardService)
+) -> LegalityCheck:
+    index = await service.get_legality_index()
+    # Resolve cards given by name/set/number or by another printing, as ingest does
+    card_index = await service.get_card_index()
+    return index.check_decklist(
+        card_index.canonicalize(request.decklist), request.format, settings.ROTATING_REGULATION_MARKS
+    )
+
+@router.get("/legality/rotation", response_model=RotationImpact)
+async def simulate_rotation(
+    marks: Optional[List[str]] = Query(None),
+    since: Optional[date] = None,
+    service: CardService = Depends(CardService),
+    legality_service: LegalityService = Depends(LegalityService)
+) -> RotationImpact:
+    index = await service.get_legality_index()
+    # The decklist query is blocking database work; keep it off the event loop
+    return await run_in_threadpool(
+        legality_service.simulate_rotation, index, marks or settings.ROTATING_REGULATION_MARKS, since
+    )
+
 @router.get("/{card_id}", response_model=Card)
 async def get_card(
     card_id: str,
@@ -23,4 +101,4 @@ async def get_card(
         raise HTTPException(status_code=404, detail=f"Card not found: {error_message}")
     except Exception as e:
         # Handle other unexpected errors
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -1,7 +1,44 @@
 # Similar to CardsController.cs in ASP.NET Core
 # Defines API routes and handlers for deck-related operations
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional, List
+from datetime import date
 from app.services.limitless_service import LimitlessService
+from app.services.matchup_service import MatchupService
+from app.services.card_service import CardService
+from app.services.decklist_service import DecklistParser
+from app.services.similarity_service import SimilarityService
+from app.models.tournament import MatchupMatrix
+from app.models.deck import DecklistImport, ParsedDecklist, SimilarDecksRequest, SimilarDeck
 
 
 router = APIRouter()
+
+@router.get("/matchups/{format}", response_model=MatchupMatrix)
+def get_matchup_matrix(
+    format: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    min_games: int = Query(0, ge=0),
+    confidence: float = Query(0.95, gt=0, lt=1),
+    service: MatchupService = Depends(MatchupService)
+) -> MatchupMatrix:
+    return service.get_matchup_matrix(format, start_date, end_date, min_games, confidence)
+
+@router.post("/import", response_model=ParsedDecklist)
+async def import_decklist(
+    request: DecklistImport,
+    service: CardService = Depends(CardService)
+) -> ParsedDecklist:
+    parser = DecklistParser(await service.get_card_index())
+    return parser.parse(request.text, format=request.format, archetype=request.archetype)
+
+@router.post("/similar", response_model=List[SimilarDeck])
+async def find_similar_decks(
+    request: SimilarDecksRequest,
+    card_service: CardService = Depends(CardService),
+    service: SimilarityService = Depends(SimilarityService)
+) -> List[SimilarDeck]:
+    card_index = await card_service.get_card_index()
+    return await run_in_threadpool(service.find_similar, request, card_index)
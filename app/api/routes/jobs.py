@@ -0,0 +1,32 @@
+# routes/jobs.py
+# Defines API routes for submitting and polling long-running analytics jobs
+from fastapi import APIRouter, HTTPException
+from typing import Dict, Any
+from pydantic import ValidationError
+from app.services.analytics_jobs import JOBS
+from app.services.job_service import analytics_executor
+from app.models.common import JobStatus
+import logging
+
+router = APIRouter()
+
+@router.post("/{kind}", response_model=JobStatus, status_code=202)
+async def submit_job(kind: str, payload: Dict[str, Any]) -> JobStatus:
+    if kind not in JOBS:
+        raise HTTPException(status_code=404, detail=f"Unknown analytics job: {kind}")
+    model, _ = JOBS[kind]
+    try:
+        # Validate up front so bad input fails fast instead of in a worker
+        normalized = model(**payload).model_dump(mode="json")
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+    logging.debug(f'Submitting analytics job: {kind}')
+    return await analytics_executor.submit(kind, normalized)
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str) -> JobStatus:
+    return analytics_executor.get(job_id)
+
+@router.delete("/{job_id}", response_model=JobStatus)
+async def cancel_job(job_id: str) -> JobStatus:
+    return analytics_executor.cancel(job_id)
@@ -0,0 +1,23 @@
+# routes/tournaments.py
+# Similar to TournamentsController.cs in ASP.NET Core
+# Defines API routes and handlers for tournament-related operations
+from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any
+from app.services.analytics_service import AnalyticsService
+from app.services.card_service import CardService
+from app.models.tournament import Tournament
+import logging
+
+router = APIRouter()
+
+@router.post("/")
+async def ingest_tournament(
+    tournament: Tournament,
+    card_service: CardService = Depends(CardService),
+    service: AnalyticsService = Depends(AnalyticsService)
+) -> Dict[str, Any]:
+    logging.debug(f'Ingesting tournament: {tournament.id}')
+    card_index = await card_service.get_card_index()
+    # Decklist resolution and the upserts are blocking work; keep them off the event loop
+    return await run_in_threadpool(service.ingest_tournament, tournament, card_index)
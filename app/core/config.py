@@ -42,6 +42,24 @@ def assemble_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
     
     # Cache Settings
     CACHE_TTL: int = 3600  # 1 hour in seconds
+    PAYLOAD_CACHE_MAX_ENTRIES: int = 256  # Pre-serialized card list responses
+    
+    # Format Rotation
+    # Regulation marks leaving Standard at the next rotation
+    ROTATING_REGULATION_MARKS: Union[str, List[str]] = ["H"]
+    
+    @field_validator("ROTATING_REGULATION_MARKS", mode='before')
+    def assemble_rotating_marks(cls, v: Union[str, List[str]]) -> List[str]:
+        if isinstance(v, str):
+            return [mark.strip().upper() for mark in v.split(",") if mark.strip()]
+        return [mark.upper() for mark in v]
+    
+    # Analytics Worker Pool
+    # Leave one core for the API event loop by default
+    ANALYTICS_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)
+    ANALYTICS_JOB_TIMEOUT: int = 300  # seconds
+    ANALYTICS_MAX_RESULT_BYTES: int = 16 * 1024 * 1024
+    ANALYTICS_MAX_JOBS: int = 1000  # Finished jobs kept for polling and cache hits
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -3,8 +3,10 @@
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+# Create SQLAlchemy engine using the psycopg (v3) driver from requirements.txt
+engine = create_engine(
+    str(settings.DATABASE_URL).replace("postgresql://", "postgresql+psycopg://", 1)
+)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import cards, decks
+from app.api.routes import cards, decks, tournaments, analytics, jobs
+from app.services.job_service import analytics_executor
+from app.services.similarity_service import decklist_index
 from app.core.config import settings
 import logging
 
@@ -14,7 +16,7 @@ def create_application() -> FastAPI:
     # Configure CORS
     application.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -23,6 +25,15 @@ def create_application() -> FastAPI:
     # Register routers
     application.include_router(cards.router, prefix="/api/cards", tags=["cards"])
     application.include_router(decks.router, prefix="/api/decks", tags=["decks"])
+    application.include_router(tournaments.router, prefix="/api/tournaments", tags=["tournaments"])
+    application.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
+    application.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+
+    # Start the analytics process pool with the app so workers are warm
+    application.on_event("startup")(analytics_executor.start)
+    application.on_event("shutdown")(analytics_executor.shutdown)
+    # Build the similarity index before serving so queries never wait on it
+    application.on_event("startup")(decklist_index.start)
 
     
     if __name__ == "__main__":
@@ -0,0 +1,93 @@
+# app/models/analytics.py
+# Materialized analytics aggregates. These tables are only written by
+# AnalyticsService ingest methods, which merge each new tournament or price
+# snapshot into the existing rows instead of recomputing from raw data.
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, JSON, Index
+from datetime import datetime
+from app.core.database import Base
+
+class IngestedTournament(Base):
+    """Ledger of tournaments already merged into the aggregates"""
+    __tablename__ = "ingested_tournaments"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    format = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
+    player_count = Column(Integer, nullable=False, default=0)
+    ingested_at = Column(DateTime, nullable=False, default=datetime.now)
+
+class FormatDailyTotal(Base):
+    """Number of decks (and submitted decklists) seen per format per day"""
+    __tablename__ = "format_daily_totals"
+
+    day = Column(Date, primary_key=True)
+    format = Column(String, primary_key=True)
+    deck_count = Column(Integer, nullable=False, default=0)
+    decklist_count = Column(Integer, nullable=False, default=0)
+
+class ArchetypeDailyShare(Base):
+    """Decks played per archetype per format per day"""
+    __tablename__ = "archetype_daily_shares"
+
+    day = Column(Date, primary_key=True)
+    format = Column(String, primary_key=True)
+    archetype = Column(String, primary_key=True)
+    deck_count = Column(Integer, nullable=False, default=0)
+
+class CardUsageAggregate(Base):
+    """Running card inclusion counts per format"""
+    __tablename__ = "card_usage_aggregates"
+
+    format = Column(String, primary_key=True)
+    card_key = Column(String, primary_key=True)
+    card_name = Column(String, nullable=False)
+    decks_including = Column(Integer, nullable=False, default=0)
+    total_copies = Column(Integer, nullable=False, default=0)
+
+class CardPriceSnapshot(Base):
+    """Market price of a card on a given day, used to deduplicate snapshot ingests"""
+    __tablename__ = "card_price_snapshots"
+
+    card_id = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    set_id = Column(String, nullable=False, index=True)
+    market_price = Column(Float, nullable=False)
+
+class SetPriceIndex(Base):
+    """Sum and count of card market prices per set per day"""
+    __tablename__ = "set_price_indices"
+
+    set_id = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    card_count = Column(Integer, nullable=False, default=0)
+    market_price_sum = Column(Float, nullable=False, default=0.0)
+
+class MatchupWeeklyCount(Base):
+    """
+    One cell of a weekly matchup matrix: results of archetype against
+    opponent, from archetype's point of view, for matches in that week
+    """
+    __tablename__ = "matchup_weekly_counts"
+
+    week_start = Column(Date, primary_key=True)
+    format = Column(String, primary_key=True)
+    archetype = Column(String, primary_key=True)
+    opponent = Column(String, primary_key=True)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    ties = Column(Integer, nullable=False, default=0)
+
+class StoredDecklist(Base):
+    """Submitted tournament decklist as card key -> copies, used for similarity search"""
+    __tablename__ = "stored_decklists"
+    __table_args__ = (Index("ix_stored_decklists_partition", "format", "regulation_mark"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tournament_id = Column(String, nullable=False, index=True)
+    player_id = Column(String, nullable=False)
+    format = Column(String, nullable=False)
+    regulation_mark = Column(String, nullable=True)
+    archetype = Column(String, nullable=True)
+    placing = Column(Integer, nullable=True)
+    cards = Column(JSON, nullable=False)
@@ -146,4 +146,14 @@ def convert_from_tcg_cards(cls, tcg_cards: List[Union[TCGCard, Dict[str, Any]]])
 
     def is_standard_legal(self) -> bool:
         """Check if card is legal in Standard format"""
-        return self.legalities.get("standard") == "legal"
\ No newline at end of file
+        return (self.legalities.get("standard") or "").lower() == "legal"
+
+    def market_price(self) -> Optional[float]:
+        """Lowest TCGPlayer market price across printings, if any is known"""
+        if not self.tcgplayer:
+            return None
+        prices = [
+            price.market for price in self.tcgplayer.prices.values()
+            if price is not None and price.market is not None
+        ]
+        return min(prices) if prices else None
\ No newline at end of file
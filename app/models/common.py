@@ -0,0 +1,16 @@
+# app/models/common.py
+from pydantic import BaseModel
+from typing import Optional, Any, Literal
+from datetime import datetime
+
+# "cancelling": cancel was requested while the job was already in a worker
+JobState = Literal["pending", "running", "cancelling", "completed", "failed", "cancelled", "timed_out"]
+
+class JobStatus(BaseModel):
+    id: str  # Hash of the job kind and its input
+    kind: str
+    status: JobState
+    submitted_at: datetime
+    completed_at: Optional[datetime] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
@@ -0,0 +1,85 @@
+# app/models/deck.py
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Literal
+
+class DeckCard(BaseModel):
+    count: int
+    name: str
+    set: Optional[str] = None  # PTCGO set code, e.g. "OBF"
+    number: Optional[str] = None
+    card_id: Optional[str] = None  # Resolved Pokemon TCG API card ID
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used for aggregation, preferring the resolved card ID"""
+        if self.card_id:
+            return self.card_id
+        return " ".join(part for part in (self.name, self.set, self.number) if part)
+
+class DeckList(BaseModel):
+    cards: List[DeckCard] = Field(default_factory=list)
+    archetype: Optional[str] = None
+    format: Optional[str] = None
+
+    @property
+    def total_cards(self) -> int:
+        return sum(card.count for card in self.cards)
+
+    def card_counts(self) -> Dict[str, int]:
+        """Map each card key to its total copies, merging duplicate lines"""
+        counts: Dict[str, int] = {}
+        for card in self.cards:
+            counts[card.key] = counts.get(card.key, 0) + card.count
+        return counts
+
+class DecklistImport(BaseModel):
+    text: str  # PTCGL / Limitless export text
+    format: Optional[str] = None
+    archetype: Optional[str] = None
+
+class ParsedDecklist(BaseModel):
+    decklist: DeckList
+    unresolved: List[str] = Field(default_factory=list)  # Lines that matched no known card
+    warnings: List[str] = Field(default_factory=list)
+
+class SimilarDecksRequest(BaseModel):
+    decklist: DeckList
+    format: str
+    regulation_mark: Optional[str] = None  # None searches every regulation mark of the format
+    k: int = Field(default=20, ge=1, le=500)
+    metric: Literal["cosine", "jaccard"] = "cosine"
+    max_placing: Optional[int] = Field(default=None, ge=1)  # e.g. 8 for top-8 finishes only
+
+class SimilarDeck(BaseModel):
+    decklist_id: int
+    score: float
+    tournament_id: str
+    player_id: str
+    archetype: Optional[str] = None
+    placing: Optional[int] = None
+    cards: Dict[str, int] = Field(default_factory=dict)
+
+class LegalityCheckRequest(BaseModel):
+    decklist: DeckList
+    format: str = "standard"
+
+class LegalityCheck(BaseModel):
+    format: str
+    legal: bool
+    illegal_cards: List[str] = Field(default_factory=list)  # Known cards not legal in the format
+    unknown_cards: List[str] = Field(default_factory=list)  # Card keys not found in the catalog
+    rotating_cards: List[str] = Field(default_factory=list)  # Legal now, gone after the next rotation
+
+class ArchetypeRotationImpact(BaseModel):
+    archetype: str
+    decks: int
+    decks_affected: int
+    average_copies_lost: float
+    rotating_cards: Dict[str, int] = Field(default_factory=dict)  # Card key -> decks playing it
+
+class RotationImpact(BaseModel):
+    regulation_marks: List[str]
+    catalog_cards_rotating: int
+    decks: int
+    decks_affected: int
+    archetypes: List[ArchetypeRotationImpact] = Field(default_factory=list)
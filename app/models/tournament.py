@@ -0,0 +1,46 @@
+# app/models/tournament.py
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+from app.models.deck import DeckList
+
+# Archetype recorded for players whose deck was not classified
+UNKNOWN_ARCHETYPE = "Unknown"
+
+class TournamentPlayer(BaseModel):
+    player_id: str
+    name: Optional[str] = None
+    placing: Optional[int] = None
+    archetype: Optional[str] = None
+    decklist: Optional[DeckList] = None
+
+class Pairing(BaseModel):
+    round: int
+    player1: str
+    player2: Optional[str] = None  # None for a bye
+    winner: Optional[str] = None  # Winning player ID, None for a tie
+
+class Tournament(BaseModel):
+    id: str
+    name: str
+    date: datetime
+    format: str
+    regulation_mark: Optional[str] = None  # Oldest regulation mark legal at the time
+    players: List[TournamentPlayer] = Field(default_factory=list)
+    pairings: List[Pairing] = Field(default_factory=list)
+
+class MatchupMatrix(BaseModel):
+    """
+    Archetype-vs-archetype results. Cell [i][j] describes archetypes[i]
+    playing against archetypes[j]; empty cells and mirror matches (the
+    diagonal) have None rates.
+    """
+    format: str
+    archetypes: List[str]
+    wins: List[List[int]]
+    losses: List[List[int]]
+    ties: List[List[int]]
+    win_rate: List[List[Optional[float]]]
+    ci_low: List[List[Optional[float]]]
+    ci_high: List[List[Optional[float]]]
+    confidence: float
@@ -0,0 +1,156 @@
+# CPU-heavy analytics jobs run in the analytics process pool.
+# Everything here executes inside worker processes: functions must be
+# top-level (picklable), take plain dict payloads and return JSON-able data.
+from typing import List, Optional, Dict, Any, Callable, Tuple, Type
+import json
+import signal
+import numpy as np
+from pydantic import BaseModel, Field
+from app.models.card import Card
+from app.models.deck import DeckList
+from app.models.tournament import Tournament, UNKNOWN_ARCHETYPE
+from app.services.matchup_service import (
+    WIN, LOSS, TIE, tournament_matchup_counts, matchup_rates, to_nested_list
+)
+
+class ConsistencyJob(BaseModel):
+    decklist: DeckList
+    targets: List[str]  # Card keys counted as a "hit"
+    basics: List[str] = Field(default_factory=list)  # Card keys of Basic Pokémon
+    hand_size: int = Field(default=7, ge=1, le=20)
+    draws: int = Field(default=0, ge=0, le=20)  # Extra cards drawn after the opening hand
+    trials: int = Field(default=100_000, ge=1, le=2_000_000)
+    seed: Optional[int] = None
+
+class MetaShareJob(BaseModel):
+    tournaments: List[Tournament]
+    confidence: float = Field(default=0.95, gt=0, lt=1)
+
+class CardConversionJob(BaseModel):
+    cards: List[Dict[str, Any]]  # Raw Pokemon TCG API card payloads
+
+class ResultTooLargeError(Exception):
+    pass
+
+class JobTimeoutError(Exception):
+    pass
+
+def run_consistency(job: ConsistencyJob) -> Dict[str, Any]:
+    """
+    Monte Carlo draw simulation. Reports how often the opening hand holds
+    at least one target card, the hit rate after each extra draw, and the
+    mulligan rate (no Basic Pokémon in the opening hand) when basics are given.
+    """
+    counts = job.decklist.card_counts()
+    keys = list(counts)
+    deck = np.repeat(np.arange(len(keys)), [counts[key] for key in keys])
+    seen = job.hand_size + job.draws
+    if seen > len(deck):
+        raise ValueError(f"Cannot see {seen} cards from a {len(deck)} card deck")
+
+    targets, basics = set(job.targets), set(job.basics)
+    is_target = np.isin(deck, [i for i, key in enumerate(keys) if key in targets])
+    is_basic = np.isin(deck, [i for i, key in enumerate(keys) if key in basics])
+
+    rng = np.random.default_rng(job.seed)
+    hits = np.zeros(job.draws + 1, dtype=np.int64)
+    mulligans = 0
+    chunk = max(1, 2_000_000 // len(deck))
+    for start in range(0, job.trials, chunk):
+        size = min(chunk, job.trials - start)
+        # Shuffle by random sort keys; the `seen` smallest keys are drawn in key order
+        sort_keys = rng.random((size, len(deck)))
+        drawn_positions = np.argpartition(sort_keys, seen - 1, axis=1)[:, :seen]
+        draw_order = np.argsort(np.take_along_axis(sort_keys, drawn_positions, axis=1), axis=1)
+        order = np.take_along_axis(drawn_positions, draw_order, axis=1)
+        drawn = is_target[order]
+        first_hit = np.where(drawn.any(axis=1), drawn.argmax(axis=1), seen)
+        hits += np.array([
+            np.count_nonzero(first_hit < job.hand_size + extra) for extra in range(job.draws + 1)
+        ])
+        mulligans += np.count_nonzero(~is_basic[order[:, :job.hand_size]].any(axis=1))
+
+    hit_rates = (hits / job.trials).tolist()
+    return {
+        "trials": job.trials,
+        "deck_size": int(len(deck)),
+        "opening_hand_hit_rate": hit_rates[0],
+        "hit_rate_by_draw": hit_rates,
+        "mulligan_rate": mulligans / job.trials if job.basics else None
+    }
+
+def run_meta_share(job: MetaShareJob) -> Dict[str, Any]:
+    """Archetype shares and a combined matchup matrix over a batch of tournaments."""
+    shares: Dict[str, int] = {}
+    index: Dict[str, int] = {}
+    partials = []
+    for tournament in job.tournaments:
+        for player in tournament.players:
+            archetype = player.archetype or UNKNOWN_ARCHETYPE
+            shares[archetype] = shares.get(archetype, 0) + 1
+        archetypes, counts = tournament_matchup_counts(tournament)
+        positions = np.asarray([index.setdefault(name, len(index)) for name in archetypes], dtype=np.int64)
+        partials.append((positions, counts))
+
+    size = len(index)
+    counts = np.zeros((3, size, size), dtype=np.int64)
+    for positions, partial in partials:
+        counts[np.ix_([WIN, LOSS, TIE], positions, positions)] += partial
+
+    win_rate, ci_low, ci_high = matchup_rates(counts, job.confidence)
+    total = sum(shares.values())
+
+    return {
+        "shares": {
+            archetype: count / total
+            for archetype, count in sorted(shares.items(), key=lambda item: item[1], reverse=True)
+        },
+        "archetypes": list(index),
+        "wins": counts[WIN].tolist(),
+        "losses": counts[LOSS].tolist(),
+        "ties": counts[TIE].tolist(),
+        "win_rate": to_nested_list(win_rate),
+        "ci_low": to_nested_list(ci_low),
+        "ci_high": to_nested_list(ci_high)
+    }
+
+def run_card_conversion(job: CardConversionJob) -> List[Dict[str, Any]]:
+    """Validate and convert a large raw card payload into Card models."""
+    return [card.model_dump(mode="json") for card in Card.convert_from_tcg_cards(job.cards)]
+
+# Job kind -> (input model, worker function)
+JOBS: Dict[str, Tuple[Type[BaseModel], Callable[[Any], Any]]] = {
+    "consistency": (ConsistencyJob, run_consistency),
+    "meta_share": (MetaShareJob, run_meta_share),
+    "card_conversion": (CardConversionJob, run_card_conversion),
+}
+
+def _raise_timeout(signum, frame):
+    raise JobTimeoutError("Job exceeded its time limit")
+
+def ping() -> bool:
+    """No-op submitted at startup so every worker is spawned and has imported its modules"""
+    return True
+
+def execute_job(kind: str, payload: Dict[str, Any], timeout: int, max_result_bytes: int) -> bytes:
+    """
+    Worker entry point. Runs a job under a deadline (enforced with SIGALRM
+    where the platform has it, so a timed-out job frees its worker) and
+    returns the JSON-encoded result if it fits within max_result_bytes.
+    """
+    model, func = JOBS[kind]
+    has_alarm = hasattr(signal, "SIGALRM")
+    if has_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+    try:
+        result = json.dumps(func(model(**payload))).encode("utf-8")
+    finally:
+        if has_alarm:
+            signal.alarm(0)
+
+    if len(result) > max_result_bytes:
+        raise ResultTooLargeError(
+            f"Result is {len(result)} bytes, above the {max_result_bytes} byte limit"
+        )
+    return result
@@ -0,0 +1,339 @@
+from typing import List, Optional, Dict, Any
+from collections import Counter
+from datetime import date
+from fastapi import Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.models.card import Card
+from app.models.tournament import Tournament, TournamentPlayer, UNKNOWN_ARCHETYPE
+from app.models.analytics import (
+    IngestedTournament,
+    FormatDailyTotal,
+    ArchetypeDailyShare,
+    CardUsageAggregate,
+    CardPriceSnapshot,
+    SetPriceIndex,
+    MatchupWeeklyCount,
+    StoredDecklist,
+)
+from app.services.matchup_service import weekly_matchup_rows
+from app.services.decklist_service import CardIndex
+from app.services.similarity_service import decklist_index
+
+class AnalyticsService:
+    """
+    Service for meta-share, card usage and price index analytics.
+    Ingest methods merge each new tournament or price snapshot into the
+    materialized aggregate tables with additive upserts; read methods only
+    ever query those aggregates, never raw tournament or price rows.
+    """
+    # Rows per INSERT statement, well below PostgreSQL's bind parameter limit
+    _batch_size = 1000
+
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def _merge(self, model, rows: List[Dict[str, Any]], counters: List[str]) -> None:
+        """
+        Insert rows, adding the counter columns onto any existing row with
+        the same primary key instead of replacing it.
+        """
+        keys = [column.name for column in model.__table__.primary_key.columns]
+        # Lock rows in primary key order so concurrent ingests touching the
+        # same keys wait on each other instead of deadlocking
+        rows = sorted(rows, key=lambda row: tuple(row[key] for key in keys))
+        for start in range(0, len(rows), self._batch_size):
+            stmt = insert(model).values(rows[start:start + self._batch_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=keys,
+                set_={
+                    name: model.__table__.c[name] + stmt.excluded[name]
+                    for name in counters
+                }
+            )
+            self.db.execute(stmt)
+
+    @staticmethod
+    def _resolve_decklists(tournament: Tournament, card_index: CardIndex) -> List[TournamentPlayer]:
+        """
+        Players with every decklist resolved to canonical card ids, so all
+        aggregates and stored decklists key cards the same way whichever
+        printing or export format a player submitted.
+        """
+        return [
+            player.model_copy(update={"decklist": card_index.canonicalize(player.decklist)})
+            if player.decklist else player
+            for player in tournament.players
+        ]
+
+    def ingest_tournament(self, tournament: Tournament, card_index: CardIndex) -> Dict[str, Any]:
+        """
+        Merge a tournament's decks into the archetype share and card usage
+        aggregates, and its pairings into that week's matchup counts.
+        Decklists are also stored for similarity search.
+        Tournaments already ingested are skipped.
+        """
+        # Formats are stored lowercase so reads match however the source spells them
+        tournament = tournament.model_copy(update={
+            "format": tournament.format.lower(),
+            "players": self._resolve_decklists(tournament, card_index)
+        })
+        day = tournament.date.date()
+        stats = {
+            "tournament_id": tournament.id,
+            "ingested": False,
+            "decks": len(tournament.players),
+            "decklists": 0,
+            "cards": 0
+        }
+
+        try:
+            ledger = insert(IngestedTournament).values(
+                id=tournament.id,
+                name=tournament.name,
+                format=tournament.format,
+                date=day,
+                player_count=len(tournament.players)
+            ).on_conflict_do_nothing(index_elements=["id"]).returning(IngestedTournament.id)
+            if self.db.execute(ledger).first() is None:
+                return stats
+
+            archetypes = Counter(
+                player.archetype or UNKNOWN_ARCHETYPE for player in tournament.players
+            )
+            usage: Dict[str, List[int]] = {}
+            names: Dict[str, str] = {}
+            decklists: List[Dict[str, Any]] = []
+            for player in tournament.players:
+                if not player.decklist or not player.decklist.cards:
+                    continue
+                stats["decklists"] += 1
+                for card in player.decklist.cards:
+                    names.setdefault(card.key, card.name)
+                card_counts = player.decklist.card_counts()
+                for key, count in card_counts.items():
+                    entry = usage.setdefault(key, [0, 0])
+                    entry[0] += 1
+                    entry[1] += count
+                decklists.append({
+                    "tournament_id": tournament.id,
+                    "player_id": player.player_id,
+                    "format": tournament.format,
+                    "regulation_mark": tournament.regulation_mark,
+                    "archetype": player.archetype,
+                    "placing": player.placing,
+                    "cards": card_counts
+                })
+
+            self._merge(FormatDailyTotal, [{
+                "day": day,
+                "format": tournament.format,
+                "deck_count": stats["decks"],
+                "decklist_count": stats["decklists"]
+            }], counters=["deck_count", "decklist_count"])
+
+            if archetypes:
+                self._merge(ArchetypeDailyShare, [
+                    {"day": day, "format": tournament.format, "archetype": name, "deck_count": count}
+                    for name, count in archetypes.items()
+                ], counters=["deck_count"])
+
+            if usage:
+                self._merge(CardUsageAggregate, [
+                    {
+                        "format": tournament.format,
+                        "card_key": key,
+                        "card_name": names[key],
+                        "decks_including": decks,
+                        "total_copies": copies
+                    }
+                    for key, (decks, copies) in usage.items()
+                ], counters=["decks_including", "total_copies"])
+
+            matchup_rows = weekly_matchup_rows(tournament)
+            if matchup_rows:
+                self._merge(MatchupWeeklyCount, matchup_rows, counters=["wins", "losses", "ties"])
+
+            decklist_ids: List[int] = []
+            if decklists:
+                decklist_ids = self.db.scalars(
+                    insert(StoredDecklist).returning(StoredDecklist.id, sort_by_parameter_order=True),
+                    decklists
+                ).all()
+
+            self.db.commit()
+            decklist_index.add([
+                (
+                    decklist_id,
+                    decklist["format"],
+                    decklist["regulation_mark"],
+                    decklist["placing"],
+                    decklist["cards"]
+                )
+                for decklist_id, decklist in zip(decklist_ids, decklists)
+            ])
+            stats["ingested"] = True
+            stats["cards"] = len(usage)
+            return stats
+
+        except Exception as e:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error ingesting tournament {tournament.id}: {str(e)}"
+            )
+
+    def ingest_price_snapshot(
+        self,
+        cards: List[Card],
+        snapshot_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Record today's (or snapshot_date's) market prices and merge newly
+        seen card prices into the per-set price index. Cards already recorded
+        for that day do not contribute twice.
+        """
+        day = snapshot_date or date.today()
+        rows = []
+        for card in cards:
+            price = card.market_price()
+            if price is not None:
+                rows.append({
+                    "card_id": card.id,
+                    "day": day,
+                    "set_id": card.set.id,
+                    "market_price": price
+                })
+
+        stats = {"day": day.isoformat(), "cards_priced": len(rows), "new_prices": 0, "sets_updated": 0}
+        if not rows:
+            return stats
+        rows.sort(key=lambda row: row["card_id"])
+
+        try:
+            index_rows: Dict[str, Dict[str, Any]] = {}
+            for start in range(0, len(rows), self._batch_size):
+                stmt = insert(CardPriceSnapshot).values(rows[start:start + self._batch_size])
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=["card_id", "day"]
+                ).returning(CardPriceSnapshot.set_id, CardPriceSnapshot.market_price)
+                for set_id, price in self.db.execute(stmt):
+                    entry = index_rows.setdefault(set_id, {
+                        "set_id": set_id,
+                        "day": day,
+                        "card_count": 0,
+                        "market_price_sum": 0.0
+                    })
+                    entry["card_count"] += 1
+                    entry["market_price_sum"] += price
+
+            if index_rows:
+                self._merge(
+                    SetPriceIndex,
+                    list(index_rows.values()),
+                    counters=["card_count", "market_price_sum"]
+                )
+            self.db.commit()
+
+            stats["new_prices"] = sum(entry["card_count"] for entry in index_rows.values())
+            stats["sets_updated"] = len(index_rows)
+            return stats
+
+        except Exception as e:
+            self.db.rollback()
+            raise HTTPException(status_code=500, detail=f"Error ingesting price snapshot: {str(e)}")
+
+    def get_meta_share(
+        self,
+        format: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Share of decks played per archetype within a date window,
+        ordered from most to least played.
+        """
+        format = format.lower()
+        share_query = select(
+            ArchetypeDailyShare.archetype,
+            func.sum(ArchetypeDailyShare.deck_count)
+        ).where(ArchetypeDailyShare.format == format)
+        total_query = select(func.sum(FormatDailyTotal.deck_count)).where(
+            FormatDailyTotal.format == format
+        )
+        if start_date:
+            share_query = share_query.where(ArchetypeDailyShare.day >= start_date)
+            total_query = total_query.where(FormatDailyTotal.day >= start_date)
+        if end_date:
+            share_query = share_query.where(ArchetypeDailyShare.day <= end_date)
+            total_query = total_query.where(FormatDailyTotal.day <= end_date)
+
+        total = self.db.execute(total_query).scalar() or 0
+        if not total:
+            return []
+
+        rows = self.db.execute(
+            share_query.group_by(ArchetypeDailyShare.archetype)
+        ).all()
+        shares = [
+            {"archetype": archetype, "deck_count": int(count), "share": count / total}
+            for archetype, count in rows
+        ]
+        return sorted(shares, key=lambda row: row["deck_count"], reverse=True)
+
+    def get_card_usage(self, format: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Most played cards in a format with their inclusion rate across
+        submitted decklists and average copies per including deck.
+        """
+        format = format.lower()
+        total = self.db.execute(
+            select(func.sum(FormatDailyTotal.decklist_count)).where(
+                FormatDailyTotal.format == format
+            )
+        ).scalar() or 0
+        if not total:
+            return []
+
+        rows = self.db.execute(
+            select(CardUsageAggregate)
+            .where(CardUsageAggregate.format == format)
+            .order_by(CardUsageAggregate.decks_including.desc())
+            .limit(limit)
+        ).scalars()
+        return [
+            {
+                "card_key": row.card_key,
+                "card_name": row.card_name,
+                "decks_including": row.decks_including,
+                "inclusion_rate": row.decks_including / total,
+                "average_copies": row.total_copies / row.decks_including
+            }
+            for row in rows
+        ]
+
+    def get_price_index(
+        self,
+        set_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Average card market price for a set, one point per snapshot day."""
+        query = select(SetPriceIndex).where(SetPriceIndex.set_id == set_id)
+        if start_date:
+            query = query.where(SetPriceIndex.day >= start_date)
+        if end_date:
+            query = query.where(SetPriceIndex.day <= end_date)
+
+        rows = self.db.execute(query.order_by(SetPriceIndex.day)).scalars()
+        return [
+            {
+                "day": row.day.isoformat(),
+                "card_count": row.card_count,
+                "index": row.market_price_sum / row.card_count
+            }
+            for row in rows
+            if row.card_count
+        ]
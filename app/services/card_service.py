@@ -1,11 +1,14 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import asyncio
 from fastapi import HTTPException
 from pokemontcgsdk import Card as TCGCard
 from pokemontcgsdk import Set as TCGSet
 from pokemontcgsdk import RestClient
 from app.models.card import Card
 from app.core.config import settings
+from app.services.decklist_service import CardIndex
+from app.services.legality_service import LegalityIndex
 from pokemontcgsdk.restclient import PokemonTcgException
 
 class CardService:
@@ -13,6 +16,14 @@ class CardService:
     Service for managing Pokemon card data, handling both TCG SDK interactions
     and local database operations.
     """
+    # Card resolution and legality indexes over the Expanded catalog,
+    # shared across instances
+    _card_index: Optional[CardIndex] = None
+    _legality_index: Optional[LegalityIndex] = None
+    _card_index_timestamp: Optional[datetime] = None
+    # Created on first use so it binds to the running event loop
+    _card_index_lock: Optional[asyncio.Lock] = None
+
     def __init__(self):
         # Initialize the SDK with our API key
         RestClient.configure(settings.POKEMON_TCG_API_KEY)
@@ -42,7 +53,6 @@ async def _run_sync(self, func):
         """
         Helper method to run synchronous SDK calls in an async context.
         """
-        import asyncio
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, func)
 
@@ -80,6 +90,66 @@ async def get_standard_sets(self) -> List[str]:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error fetching standard sets: {str(e)}")
 
+    def _catalog_indexes_fresh(self) -> bool:
+        return (
+            CardService._card_index is not None
+            and CardService._card_index_timestamp is not None
+            and datetime.now() - CardService._card_index_timestamp < self._cache_duration
+        )
+
+    @staticmethod
+    def _build_catalog_indexes() -> Tuple[CardIndex, LegalityIndex]:
+        """
+        Fetch the Expanded catalog and build both indexes (blocking).
+        Cards banned in Expanded are included so legality checks report them
+        as illegal rather than unknown.
+        """
+        cards = Card.convert_from_tcg_cards(TCGCard.where(
+            q='(legalities.expanded:legal OR legalities.expanded:banned)'
+        ))
+        card_index = CardIndex(cards)
+        return card_index, LegalityIndex(cards, card_index.canonical)
+
+    async def refresh_catalog_indexes(self, force: bool = False) -> None:
+        """
+        Rebuild the card resolution and legality indexes from all Expanded
+        legal or banned cards, unless the cached copies are less than a day old.
+        Only one rebuild runs at a time; requests arriving meanwhile wait
+        for it and reuse its result.
+        """
+        if not force and self._catalog_indexes_fresh():
+            return
+
+        requested_at = datetime.now()
+        if CardService._card_index_lock is None:
+            CardService._card_index_lock = asyncio.Lock()
+        async with CardService._card_index_lock:
+            # Another request may have rebuilt the indexes while we waited
+            rebuilt = (
+                CardService._card_index_timestamp is not None
+                and CardService._card_index_timestamp >= requested_at
+            )
+            if rebuilt or (not force and self._catalog_indexes_fresh()):
+                return
+
+            try:
+                card_index, legality_index = await self._run_sync(self._build_catalog_indexes)
+                CardService._card_index = card_index
+                CardService._legality_index = legality_index
+                CardService._card_index_timestamp = datetime.now()
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error building card indexes: {str(e)}")
+
+    async def get_card_index(self) -> CardIndex:
+        """Get the decklist card resolution index."""
+        await self.refresh_catalog_indexes()
+        return CardService._card_index
+
+    async def get_legality_index(self) -> LegalityIndex:
+        """Get the format legality and rotation index."""
+        await self.refresh_catalog_indexes()
+        return CardService._legality_index
+
     async def get_cards_by_set(self, set_id: str) -> List[Card]:
         """
         Retrieve all cards from a specific set.
@@ -105,6 +175,10 @@ async def sync_standard_cards(self) -> Dict[str, Any]:
         }
 
         try:
+            # Rebuild the catalog indexes so legality reflects this sync
+            await self.refresh_catalog_indexes(force=True)
+            standard_legal = CardService._legality_index.legal_cards("standard")
+
             # Get all standard sets
             standard_sets = await self.get_standard_sets()
             
@@ -115,13 +189,12 @@ async def sync_standard_cards(self) -> Dict[str, Any]:
                     cards = await self.get_cards_by_set(set_id)
                     stats["total_cards_processed"] += len(cards)
                     
-                    for card in cards:
-                        if card.is_standard_legal():
-                            # TODO: Once DB is implemented:
-                            # 1. Check if card exists in DB
-                            # 2. If exists, update if needed and increment cards_updated
-                            # 3. If doesn't exist, insert and increment new_cards_added
-                            stats["new_cards_added"] += 1  # Temporary placeholder
+                    legal_ids = {card.id for card in cards} & standard_legal
+                    # TODO: Once DB is implemented:
+                    # 1. Check if card exists in DB
+                    # 2. If exists, update if needed and increment cards_updated
+                    # 3. If doesn't exist, insert and increment new_cards_added
+                    stats["new_cards_added"] += len(legal_ids)  # Temporary placeholder
                             
                 except Exception as e:
                     stats["errors"].append(f"Error processing set {set_id}: {str(e)}")
@@ -0,0 +1,222 @@
+from typing import List, Optional, Dict, Tuple, Iterable
+from functools import lru_cache
+import re
+import unicodedata
+from app.models.card import Card
+from app.models.deck import DeckCard, DeckList, ParsedDecklist
+
+# "4 Charizard ex OBF 125", "* 2 Iono PAL 185" (legacy PTCGO) or "3 Boss's Orders"
+_CARD_LINE = re.compile(
+    r"^\*?\s*(?P<count>\d+)\s+(?P<name>.+?)"
+    r"(?:\s+(?P<set>[A-Z0-9-]{2,8})\s+(?P<number>[A-Za-z]*\d[A-Za-z0-9-]*))?\s*$"
+)
+# "Pokémon: 12", "Trainer (36):", "Energy: 12"
+_SECTION_LINE = re.compile(
+    r"^(?P<section>Pok[eé]mon|Trainers?|Energy|Energies)\s*(?:\((?P<paren>\d+)\))?\s*:\s*(?P<count>\d+)?\s*$",
+    re.IGNORECASE
+)
+# Legacy PTCGO basic energy: "9 Basic {R} Energy Energy 2"
+_LEGACY_ENERGY_LINE = re.compile(
+    r"^\*?\s*(?P<count>\d+)\s+Basic\s+\{(?P<symbol>[GRWLPFDMY])\}\s+Energy\s+Energy\s+\d+\s*$",
+    re.IGNORECASE
+)
+_ENERGY_TYPES = {
+    "G": "Grass", "R": "Fire", "W": "Water", "L": "Lightning", "P": "Psychic",
+    "F": "Fighting", "D": "Darkness", "M": "Metal", "Y": "Fairy",
+}
+_TOTAL_LINE = re.compile(r"^Total\s+Cards\s*:\s*(?P<count>\d+)\s*$", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+@lru_cache(maxsize=16384)
+def normalize_name(name: str) -> str:
+    """Lowercase, accent-free, single-spaced card name for lookups"""
+    decomposed = unicodedata.normalize("NFKD", name.replace("’", "'"))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE.sub(" ", stripped).strip().lower()
+
+def _normalize_number(number: str) -> str:
+    """Collector number without leading zeros, so "SVP 085" matches "85" """
+    return number.upper().lstrip("0") or "0"
+
+def _match_card_line(line: str) -> Optional[Tuple[int, str, Optional[str], Optional[str]]]:
+    """(count, name, set code, number) of a card line, or None for other lines"""
+    match = _LEGACY_ENERGY_LINE.match(line)
+    if match:
+        energy_type = _ENERGY_TYPES[match.group("symbol").upper()]
+        return int(match.group("count")), f"Basic {energy_type} Energy", None, None
+    match = _CARD_LINE.match(line)
+    if match:
+        return (int(match.group("count")),) + match.group("name", "set", "number")
+    return None
+
+def _functional_key(card: Card) -> Tuple:
+    """
+    Cards sharing this key play identically. Pokémon must match name, HP,
+    attacks and abilities; Trainers and Energy only need to share a name.
+    """
+    name = normalize_name(card.name)
+    if card.supertype.lower().startswith("pok"):
+        return (
+            "pokemon",
+            name,
+            card.hp,
+            tuple(
+                (attack.name, tuple(attack.cost), attack.damage, attack.text)
+                for attack in card.attacks or []
+            ),
+            tuple((ability.name, ability.text) for ability in card.abilities or []),
+        )
+    return (card.supertype.lower(), name)
+
+class CardIndex:
+    """
+    Precomputed lookups over the card catalog for decklist resolution:
+    (ptcgoCode, number) -> card id, normalized name -> card ids, and
+    card id -> canonical id shared by every functional reprint, plus each
+    printing's name, set code and number.
+    The canonical id is the most recently released printing.
+    """
+    def __init__(self, cards: Iterable[Card]):
+        self.by_code: Dict[Tuple[str, str], str] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.canonical: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        self.printings: Dict[str, Tuple[Optional[str], str]] = {}
+
+        groups: Dict[Tuple, List[Card]] = {}
+        for card in cards:
+            self.names[card.id] = card.name
+            self.printings[card.id] = (card.set.ptcgoCode, card.number)
+            if card.set.ptcgoCode:
+                self.by_code[(card.set.ptcgoCode.upper(), _normalize_number(card.number))] = card.id
+            self.by_name.setdefault(normalize_name(card.name), []).append(card.id)
+            groups.setdefault(_functional_key(card), []).append(card)
+
+        for printings in groups.values():
+            canonical = max(printings, key=lambda card: (card.set.releaseDate, card.id)).id
+            for card in printings:
+                self.canonical[card.id] = canonical
+
+    def __len__(self) -> int:
+        return len(self.canonical)
+
+    def resolve(self, name: str, set_code: Optional[str], number: Optional[str]) -> Optional[str]:
+        """
+        Canonical card id for a decklist line, preferring the exact printing
+        and falling back to the name. Names shared by several different cards
+        resolve only when every printing is functionally the same card.
+        """
+        if set_code and number:
+            card_id = self.by_code.get((set_code.upper(), _normalize_number(number)))
+            if card_id:
+                return self.canonical[card_id]
+
+        key = normalize_name(name)
+        card_ids = self.by_name.get(key)
+        if card_ids is None and key.startswith("basic "):
+            # PTCGL exports "Basic Fire Energy" where older printings say "Fire Energy"
+            card_ids = self.by_name.get(key[len("basic "):])
+        if not card_ids:
+            return None
+        canonical_ids = {self.canonical[card_id] for card_id in card_ids}
+        if len(canonical_ids) == 1:
+            return canonical_ids.pop()
+        return None
+
+    def deck_card(self, card_id: str, count: int) -> DeckCard:
+        """DeckCard for a card id, named and numbered after that printing"""
+        set_code, number = self.printings[card_id]
+        return DeckCard(
+            count=count, name=self.names[card_id], set=set_code, number=number, card_id=card_id
+        )
+
+    def canonicalize(self, decklist: DeckList) -> DeckList:
+        """
+        Copy of decklist with every resolvable card replaced by its canonical
+        printing and duplicates merged; unresolvable cards are kept as given.
+        """
+        cards: Dict[str, DeckCard] = {}
+        for card in decklist.cards:
+            card_id = self.canonical.get(card.card_id) if card.card_id else None
+            if card_id is None:
+                card_id = self.resolve(card.name, card.set, card.number)
+            resolved = self.deck_card(card_id, card.count) if card_id else card.model_copy()
+            if resolved.key in cards:
+                cards[resolved.key].count += resolved.count
+            else:
+                cards[resolved.key] = resolved
+        return decklist.model_copy(update={"cards": list(cards.values())})
+
+class DecklistParser:
+    """
+    Parses PTCGL / Limitless decklist export text into DeckLists whose
+    cards are resolved to canonical card ids through a CardIndex.
+    """
+    def __init__(self, index: CardIndex):
+        self.index = index
+
+    def parse(
+        self,
+        text: str,
+        format: Optional[str] = None,
+        archetype: Optional[str] = None
+    ) -> ParsedDecklist:
+        cards: Dict[str, DeckCard] = {}
+        unresolved: List[str] = []
+        warnings: List[str] = []
+        sections: List[Tuple[str, int, int]] = []  # (name, declared, parsed)
+        declared_total: Optional[int] = None
+
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            card_line = _match_card_line(line)
+            if card_line:
+                count, name, set_code, number = card_line
+                if sections:
+                    section, declared, parsed = sections[-1]
+                    sections[-1] = (section, declared, parsed + count)
+
+                card_id = self.index.resolve(name, set_code, number)
+                if card_id is None:
+                    unresolved.append(line)
+                    card = DeckCard(count=count, name=name, set=set_code, number=number)
+                else:
+                    # Lines naming different reprints merge into the canonical printing
+                    card = self.index.deck_card(card_id, count)
+
+                if card.key in cards:
+                    cards[card.key].count += count
+                else:
+                    cards[card.key] = card
+                continue
+
+            match = _SECTION_LINE.match(line)
+            if match:
+                declared = match.group("count") or match.group("paren")
+                sections.append((match.group("section"), int(declared) if declared else -1, 0))
+                continue
+
+            match = _TOTAL_LINE.match(line)
+            if match:
+                declared_total = int(match.group("count"))
+                continue
+
+            warnings.append(f"Unrecognized line: {line}")
+
+        for section, declared, parsed in sections:
+            if declared >= 0 and declared != parsed:
+                warnings.append(f"{section} section declares {declared} cards but lists {parsed}")
+
+        decklist = DeckList(cards=list(cards.values()), format=format, archetype=archetype)
+        if declared_total is not None and declared_total != decklist.total_cards:
+            warnings.append(
+                f"Total Cards declares {declared_total} but list contains {decklist.total_cards}"
+            )
+
+        return ParsedDecklist(decklist=decklist, unresolved=unresolved, warnings=warnings)
+
+    def parse_many(self, texts: Iterable[str], format: Optional[str] = None) -> List[ParsedDecklist]:
+        return [self.parse(text, format=format) for text in texts]
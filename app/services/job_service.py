@@ -0,0 +1,240 @@
+from typing import Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import json
+import logging
+from fastapi import HTTPException
+from app.core.config import settings
+from app.models.common import JobStatus
+from app.services.analytics_jobs import JOBS, JobTimeoutError, execute_job, ping
+
+class _Job:
+    def __init__(self, job_id: str, kind: str, pool: ProcessPoolExecutor, future: Future):
+        self.id = job_id
+        self.kind = kind
+        self.pool = pool
+        self.future = future
+        self.task: Optional[asyncio.Task] = None
+        self.status = "pending"
+        self.submitted_at = datetime.now()
+        self.completed_at: Optional[datetime] = None
+        self.result: Optional[bytes] = None
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status not in ("pending", "running")
+
+    def to_status(self) -> JobStatus:
+        status = self.status
+        if status == "pending" and self.future.running():
+            status = "running"
+        if self.cancel_requested and not self.finished:
+            status = "cancelling"
+        return JobStatus(
+            id=self.id,
+            kind=self.kind,
+            status=status,
+            submitted_at=self.submitted_at,
+            completed_at=self.completed_at,
+            result=json.loads(self.result) if self.result is not None else None,
+            error=self.error
+        )
+
+class AnalyticsExecutor:
+    """
+    Runs CPU-heavy analytics jobs in a managed process pool so they use
+    every core without blocking the API event loop (unlike the default
+    thread pool behind CardService._run_sync, which the GIL serializes).
+
+    Jobs are keyed by a hash of their kind and input: resubmitting the same
+    input while a job is in flight, or while its result is cached, returns
+    the existing job instead of running it again.
+
+    If a worker dies (e.g. killed for memory) the pool breaks: every job
+    still on it fails and the pool is replaced with a freshly warmed one.
+    """
+    def __init__(
+        self,
+        max_workers: int,
+        job_timeout: int,
+        max_result_bytes: int,
+        max_jobs: int,
+        result_ttl: int
+    ):
+        self.max_workers = max_workers
+        self.job_timeout = job_timeout
+        self.max_result_bytes = max_result_bytes
+        self.max_jobs = max_jobs
+        self.result_ttl = timedelta(seconds=result_ttl)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, _Job] = {}
+        self._restart_lock: Optional[asyncio.Lock] = None
+        self._queue_poll_seconds = 0.1
+
+    async def start(self) -> None:
+        """Create the pool and spawn every worker before the first request."""
+        if self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._pool, ping) for _ in range(self.max_workers)
+        ))
+        logging.info(f'Analytics process pool started with {self.max_workers} workers')
+
+    async def shutdown(self) -> None:
+        if self._pool is None:
+            return
+        for job in self._jobs.values():
+            if not job.finished:
+                job.future.cancel()
+                job.task.cancel()
+        self._pool.shutdown(wait=False)
+        self._pool = None
+
+    async def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken pool with a new one, once however many jobs report it."""
+        if self._restart_lock is None:
+            self._restart_lock = asyncio.Lock()
+        async with self._restart_lock:
+            if self._pool is not broken:
+                # Already replaced, or the executor has been shut down
+                return
+            logging.error('Analytics process pool is broken; restarting workers')
+            self._pool = None
+            broken.shutdown(wait=False)
+            await self.start()
+
+    @staticmethod
+    def job_id(kind: str, payload: Dict[str, Any]) -> str:
+        encoded = json.dumps({"kind": kind, "payload": payload}, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _evict(self) -> None:
+        """Drop expired results, then the oldest finished jobs beyond max_jobs."""
+        now = datetime.now()
+        for job_id in [
+            job.id for job in self._jobs.values()
+            if job.finished and now - job.completed_at >= self.result_ttl
+        ]:
+            del self._jobs[job_id]
+
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.completed_at
+        )
+        for job in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job.id]
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> JobStatus:
+        if kind not in JOBS:
+            raise HTTPException(status_code=404, detail=f"Unknown analytics job: {kind}")
+        if self._pool is None:
+            raise HTTPException(status_code=503, detail="Analytics workers are not running")
+
+        self._evict()
+        job_id = self.job_id(kind, payload)
+        existing = self._jobs.get(job_id)
+        if (
+            existing is not None
+            and existing.status in ("pending", "running", "completed")
+            and not existing.cancel_requested
+        ):
+            return existing.to_status()
+
+        pool = self._pool
+        try:
+            future = pool.submit(execute_job, kind, payload, self.job_timeout, self.max_result_bytes)
+        except BrokenProcessPool:
+            await self._restart(pool)
+            pool = self._pool
+            if pool is None:
+                raise HTTPException(status_code=503, detail="Analytics workers are not running")
+            future = pool.submit(execute_job, kind, payload, self.job_timeout, self.max_result_bytes)
+        job = _Job(job_id, kind, pool, future)
+        job.task = asyncio.ensure_future(self._watch(job))
+        self._jobs[job_id] = job
+        return job.to_status()
+
+    async def _watch(self, job: _Job) -> None:
+        """
+        Wait for a job's result. Workers enforce job_timeout themselves
+        (SIGALRM), counted from when the job starts; time spent queued for a
+        worker does not count. The event loop only gives up as a backstop,
+        for workers that cannot be interrupted.
+        """
+        broken = False
+        try:
+            while not job.future.running() and not job.future.done():
+                await asyncio.sleep(self._queue_poll_seconds)
+            # The pool marks a job running once it is handed to the call queue,
+            # where it can still wait behind one job per worker, so the backstop
+            # allows two full job timeouts plus a grace period for the error to arrive
+            job.result = await asyncio.wait_for(
+                asyncio.wrap_future(job.future), timeout=2 * self.job_timeout + 5
+            )
+            job.status = "completed"
+        except (asyncio.TimeoutError, JobTimeoutError):
+            job.status = "timed_out"
+            job.error = f"Job exceeded {self.job_timeout} seconds"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except BrokenProcessPool as e:
+            job.status = "failed"
+            job.error = f"Analytics worker process died: {str(e)}"
+            broken = True
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {str(e)}"
+        finally:
+            if job.cancel_requested and job.status != "cancelled":
+                # The worker has finished with a cancelled job; drop whatever it produced
+                job.status = "cancelled"
+                job.result = None
+                job.error = None
+            job.completed_at = datetime.now()
+
+        if broken:
+            try:
+                await self._restart(job.pool)
+            except Exception as e:
+                logging.error(f'Could not restart analytics process pool: {str(e)}')
+
+    def get(self, job_id: str) -> JobStatus:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        return job.to_status()
+
+    def cancel(self, job_id: str) -> JobStatus:
+        """
+        Cancel a job. A queued job is cancelled at once and never runs. A
+        job already handed to a worker cannot be interrupted: it reports
+        "cancelling" until the worker finishes (or times out), then
+        "cancelled", and its result is discarded.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        if not job.finished:
+            if job.future.cancel():
+                job.task.cancel()
+                job.status = "cancelled"
+                job.completed_at = datetime.now()
+            else:
+                job.cancel_requested = True
+        return job.to_status()
+
+# Shared by every request; started and stopped with the application
+analytics_executor = AnalyticsExecutor(
+    max_workers=settings.ANALYTICS_WORKERS,
+    job_timeout=settings.ANALYTICS_JOB_TIMEOUT,
+    max_result_bytes=settings.ANALYTICS_MAX_RESULT_BYTES,
+    max_jobs=settings.ANALYTICS_MAX_JOBS,
+    result_ttl=settings.CACHE_TTL
+)
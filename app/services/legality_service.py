@@ -0,0 +1,152 @@
+from typing import List, Optional, Dict, Iterable, Set, FrozenSet, Tuple
+from collections import Counter
+from datetime import date, timedelta
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.models.card import Card
+from app.models.deck import DeckList, LegalityCheck, ArchetypeRotationImpact, RotationImpact
+from app.models.analytics import StoredDecklist, IngestedTournament
+from app.models.tournament import UNKNOWN_ARCHETYPE
+
+class LegalityIndex:
+    """
+    Precomputed format legality over the card catalog:
+    format -> legal card ids and regulation mark -> card ids.
+
+    A card is legal when any functional reprint of it is legal (the
+    reprint rule), so legality is resolved per reprint group using the
+    canonical mapping from CardIndex.
+    """
+    def __init__(self, cards: Iterable[Card], canonical: Dict[str, str]):
+        self.canonical = canonical
+        self._marks: Dict[str, Optional[str]] = {}
+        printing_legal: Dict[str, Set[str]] = {}
+        members: Dict[str, Set[str]] = {}
+
+        marks: Dict[str, Set[str]] = {}
+        for card in cards:
+            group = canonical.get(card.id, card.id)
+            members.setdefault(group, set()).add(card.id)
+            mark = card.regulationMark.upper() if card.regulationMark else None
+            self._marks[card.id] = mark
+            if mark:
+                marks.setdefault(mark, set()).add(card.id)
+            for format, status in card.legalities.items():
+                if status and status.lower() == "legal":
+                    printing_legal.setdefault(format.lower(), set()).add(card.id)
+
+        self.by_mark: Dict[str, FrozenSet[str]] = {mark: frozenset(ids) for mark, ids in marks.items()}
+        self._members = members
+        self._printing_legal = {format: frozenset(ids) for format, ids in printing_legal.items()}
+        self.by_format: Dict[str, FrozenSet[str]] = {
+            format: self._expand(ids) for format, ids in printing_legal.items()
+        }
+        self._rotation_cache: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
+    def _expand(self, card_ids: Iterable[str]) -> FrozenSet[str]:
+        """All printings of every reprint group containing one of card_ids"""
+        groups = {self.canonical.get(card_id, card_id) for card_id in card_ids}
+        return frozenset().union(*(self._members.get(group, ()) for group in groups))
+
+    def __contains__(self, card_id: str) -> bool:
+        return card_id in self._marks
+
+    def legal_cards(self, format: str) -> FrozenSet[str]:
+        return self.by_format.get(format.lower(), frozenset())
+
+    def is_legal(self, card_id: str, format: str) -> bool:
+        return card_id in self.legal_cards(format)
+
+    def illegal_cards(self, card_ids: Iterable[str], format: str) -> Set[str]:
+        """Known card ids from card_ids that are not legal in format"""
+        known = {card_id for card_id in card_ids if card_id in self._marks}
+        return known - self.legal_cards(format)
+
+    def rotating_cards(self, marks: Iterable[str]) -> FrozenSet[str]:
+        """
+        Cards legal in Standard now that would not be once the given
+        regulation marks rotate out, i.e. no reprint with a surviving mark.
+        """
+        key = tuple(sorted({mark.upper() for mark in marks}))
+        if key not in self._rotation_cache:
+            leaving = set(key)
+            surviving = self._expand(
+                card_id for card_id in self._printing_legal.get("standard", ())
+                if self._marks.get(card_id) not in leaving
+            )
+            self._rotation_cache[key] = self.legal_cards("standard") - surviving
+        return self._rotation_cache[key]
+
+    def check_decklist(self, decklist: DeckList, format: str, marks: Iterable[str]) -> LegalityCheck:
+        card_ids = set(decklist.card_counts())
+        illegal = self.illegal_cards(card_ids, format)
+        unknown = {card_id for card_id in card_ids if card_id not in self._marks}
+        rotating = (card_ids & self.rotating_cards(marks)) if format.lower() == "standard" else set()
+        return LegalityCheck(
+            format=format,
+            legal=not illegal and not unknown,
+            illegal_cards=sorted(illegal),
+            unknown_cards=sorted(unknown),
+            rotating_cards=sorted(rotating)
+        )
+
+class LegalityService:
+    """
+    Service for rotation what-if analysis: applies an upcoming rotation to
+    recent Standard decklists and reports how each archetype is affected.
+    """
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def simulate_rotation(
+        self,
+        index: LegalityIndex,
+        marks: List[str],
+        since: Optional[date] = None,
+        top_cards: int = 5
+    ) -> RotationImpact:
+        """Impact of rotating out `marks` on Standard decklists played since `since` (default 30 days)."""
+        rotating = index.rotating_cards(marks)
+        try:
+            rows = self.db.execute(
+                select(StoredDecklist.archetype, StoredDecklist.cards)
+                .join(IngestedTournament, IngestedTournament.id == StoredDecklist.tournament_id)
+                .where(StoredDecklist.format == "standard")
+                .where(IngestedTournament.date >= (since or date.today() - timedelta(days=30)))
+            ).all()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error fetching decklists: {str(e)}")
+
+        archetypes: Dict[str, Dict] = {}
+        for archetype, cards in rows:
+            entry = archetypes.setdefault(archetype or UNKNOWN_ARCHETYPE, {
+                "decks": 0, "affected": 0, "copies_lost": 0, "cards": Counter()
+            })
+            lost = cards.keys() & rotating
+            entry["decks"] += 1
+            if lost:
+                entry["affected"] += 1
+                entry["copies_lost"] += sum(cards[card_id] for card_id in lost)
+                entry["cards"].update(lost)
+
+        impacts = [
+            ArchetypeRotationImpact(
+                archetype=archetype,
+                decks=entry["decks"],
+                decks_affected=entry["affected"],
+                average_copies_lost=entry["copies_lost"] / entry["decks"],
+                rotating_cards=dict(entry["cards"].most_common(top_cards))
+            )
+            for archetype, entry in archetypes.items()
+        ]
+        impacts.sort(key=lambda impact: impact.decks, reverse=True)
+
+        return RotationImpact(
+            regulation_marks=sorted({mark.upper() for mark in marks}),
+            catalog_cards_rotating=len(rotating),
+            decks=len(rows),
+            decks_affected=sum(impact.decks_affected for impact in impacts),
+            archetypes=impacts
+        )
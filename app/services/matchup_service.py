@@ -0,0 +1,206 @@
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, timedelta
+from statistics import NormalDist
+import numpy as np
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.models.tournament import Tournament, MatchupMatrix, UNKNOWN_ARCHETYPE
+from app.models.analytics import MatchupWeeklyCount
+
+# Result categories along the first axis of a counts array
+WIN, LOSS, TIE = 0, 1, 2
+
+def week_start(day: date) -> date:
+    """Monday of the week containing day"""
+    return day - timedelta(days=day.weekday())
+
+def count_matchups(
+    archetypes_a: np.ndarray,
+    archetypes_b: np.ndarray,
+    outcomes: np.ndarray,
+    size: int
+) -> np.ndarray:
+    """
+    Build a (3, size, size) array of wins, losses and ties in one pass.
+
+    archetypes_a and archetypes_b hold archetype indices for each side of a
+    match, outcomes is +1 when side a won, -1 when side b won and 0 for a tie.
+    Every match between different archetypes is counted from both sides, so
+    counts[WIN, i, j] equals counts[LOSS, j, i] for i != j. Mirror matches
+    land on the diagonal once, from side a, so summing row i gives the real
+    number of games archetype i played.
+    """
+    distinct = archetypes_a != archetypes_b
+    rows = np.concatenate([archetypes_a, archetypes_b[distinct]])
+    cols = np.concatenate([archetypes_b, archetypes_a[distinct]])
+    results = np.concatenate([outcomes, -outcomes[distinct]])
+    categories = np.where(results > 0, WIN, np.where(results < 0, LOSS, TIE))
+    flat = (categories * size + rows) * size + cols
+    return np.bincount(flat, minlength=3 * size * size).reshape(3, size, size)
+
+def wilson_interval(
+    successes: np.ndarray,
+    trials: np.ndarray,
+    confidence: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized Wilson score interval; cells with no trials are NaN."""
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / trials
+        denominator = 1 + z ** 2 / trials
+        center = (p + z ** 2 / (2 * trials)) / denominator
+        margin = z * np.sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    empty = trials == 0
+    return np.where(empty, np.nan, center - margin), np.where(empty, np.nan, center + margin)
+
+def matchup_rates(
+    counts: np.ndarray,
+    confidence: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Win rate (a tie counts as half a win) and Wilson interval bounds for
+    every cell of a (3, n, n) counts array. Empty cells are NaN, and so is
+    the diagonal: a mirror match is counted once, from one seat, so its
+    result says nothing about the archetype.
+    """
+    games = counts.sum(axis=0)
+    points = counts[WIN] + 0.5 * counts[TIE]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = np.where(games > 0, points / games, np.nan)
+    ci_low, ci_high = wilson_interval(points, games, confidence)
+    mirror = np.eye(len(games), dtype=bool)
+    return (
+        np.where(mirror, np.nan, win_rate),
+        np.where(mirror, np.nan, ci_low),
+        np.where(mirror, np.nan, ci_high)
+    )
+
+def tournament_matchup_counts(tournament: Tournament) -> Tuple[List[str], np.ndarray]:
+    """
+    Turn a tournament's round pairings into archetype names and their
+    (3, n, n) counts array. Byes are ignored.
+    """
+    player_archetypes = {
+        player.player_id: player.archetype or UNKNOWN_ARCHETYPE
+        for player in tournament.players
+    }
+    index: Dict[str, int] = {}
+    side_a, side_b, outcomes = [], [], []
+    for pairing in tournament.pairings:
+        if pairing.player2 is None:
+            continue
+        archetype_a = player_archetypes.get(pairing.player1, UNKNOWN_ARCHETYPE)
+        archetype_b = player_archetypes.get(pairing.player2, UNKNOWN_ARCHETYPE)
+        side_a.append(index.setdefault(archetype_a, len(index)))
+        side_b.append(index.setdefault(archetype_b, len(index)))
+        if pairing.winner == pairing.player1:
+            outcomes.append(1)
+        elif pairing.winner == pairing.player2:
+            outcomes.append(-1)
+        else:
+            outcomes.append(0)
+
+    counts = count_matchups(
+        np.asarray(side_a, dtype=np.int64),
+        np.asarray(side_b, dtype=np.int64),
+        np.asarray(outcomes, dtype=np.int64),
+        len(index)
+    )
+    return list(index), counts
+
+def weekly_matchup_rows(tournament: Tournament) -> List[Dict[str, Any]]:
+    """Non-empty cells of a tournament's matchup matrix, keyed by its week"""
+    archetypes, counts = tournament_matchup_counts(tournament)
+    week = week_start(tournament.date.date())
+    rows_idx, cols_idx = np.nonzero(counts.sum(axis=0))
+    return [
+        {
+            "week_start": week,
+            "format": tournament.format,
+            "archetype": archetypes[i],
+            "opponent": archetypes[j],
+            "wins": int(counts[WIN, i, j]),
+            "losses": int(counts[LOSS, i, j]),
+            "ties": int(counts[TIE, i, j])
+        }
+        for i, j in zip(rows_idx, cols_idx)
+    ]
+
+def to_nested_list(values: np.ndarray) -> List[List[Optional[float]]]:
+    """Convert a float matrix to lists, mapping NaN to None for JSON output"""
+    return [[None if np.isnan(v) else float(v) for v in row] for row in values]
+
+class MatchupService:
+    """
+    Service for archetype-vs-archetype matchup analysis.
+    Matrices are assembled by summing the per-week partial counts stored at
+    tournament ingest, so any date window costs one query and one numpy pass.
+    """
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def get_matchup_matrix(
+        self,
+        format: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_games: int = 0,
+        confidence: float = 0.95
+    ) -> MatchupMatrix:
+        """
+        Win/loss/tie matrix for a format over the weeks overlapping the
+        window. Win rates count a tie as half a win and are None for mirror
+        matches; archetypes with fewer than min_games total games are dropped.
+        """
+        format = format.lower()
+        try:
+            query = select(
+                MatchupWeeklyCount.archetype,
+                MatchupWeeklyCount.opponent,
+                MatchupWeeklyCount.wins,
+                MatchupWeeklyCount.losses,
+                MatchupWeeklyCount.ties
+            ).where(MatchupWeeklyCount.format == format)
+            if start_date:
+                query = query.where(MatchupWeeklyCount.week_start >= week_start(start_date))
+            if end_date:
+                query = query.where(MatchupWeeklyCount.week_start <= end_date)
+            rows = self.db.execute(query).all()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error fetching matchup data: {str(e)}")
+
+        index: Dict[str, int] = {}
+        rows_idx = np.fromiter(
+            (index.setdefault(row[0], len(index)) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        cols_idx = np.fromiter(
+            (index.setdefault(row[1], len(index)) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        values = np.asarray([row[2:] for row in rows], dtype=np.int64).reshape(-1, 3)
+
+        size = len(index)
+        counts = np.zeros((3, size, size), dtype=np.int64)
+        for category in (WIN, LOSS, TIE):
+            np.add.at(counts[category], (rows_idx, cols_idx), values[:, category])
+
+        archetypes = np.asarray(list(index), dtype=object)
+        games = counts.sum(axis=0)
+        keep = games.sum(axis=1) >= min_games
+        order = np.argsort(-games.sum(axis=1)[keep], kind="stable")
+        selected = np.flatnonzero(keep)[order]
+        counts = counts[:, selected][:, :, selected]
+        win_rate, ci_low, ci_high = matchup_rates(counts, confidence)
+
+        return MatchupMatrix(
+            format=format,
+            archetypes=[str(name) for name in archetypes[selected]],
+            wins=counts[WIN].tolist(),
+            losses=counts[LOSS].tolist(),
+            ties=counts[TIE].tolist(),
+            win_rate=to_nested_list(win_rate),
+            ci_low=to_nested_list(ci_low),
+            ci_high=to_nested_list(ci_high),
+            confidence=confidence
+        )
@@ -0,0 +1,309 @@
+from typing import List, Optional, Dict, Tuple, Iterable
+import heapq
+import logging
+import threading
+import numpy as np
+from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.database import get_db, SessionLocal
+from app.models.analytics import StoredDecklist
+from app.models.deck import SimilarDecksRequest, SimilarDeck
+from app.services.decklist_service import CardIndex
+
+PartitionKey = Tuple[str, str]
+
+# Placing recorded for decklists without one; never passes a max_placing filter
+_NO_PLACING = np.iinfo(np.int32).max
+
+def partition_key(format: str, regulation_mark: Optional[str]) -> PartitionKey:
+    return (format.lower(), (regulation_mark or "").upper())
+
+class DecklistPartition:
+    """
+    Card-count vectors for every decklist of one format and regulation mark,
+    stored column-major (CSC: colptr / row positions / float32 counts) in
+    plain numpy, so a query only touches the columns of cards it contains.
+    A partition is never modified once built: extend() returns a new one,
+    so queries can read the arrays while decklists are being added.
+    """
+    def __init__(self):
+        self.vocabulary: Dict[str, int] = {}
+        self.ids = np.empty(0, dtype=np.int64)
+        self.colptr = np.zeros(1, dtype=np.int64)
+        self.rows = np.empty(0, dtype=np.int32)
+        self.data = np.empty(0, dtype=np.float32)
+        self.norms = np.empty(0, dtype=np.float32)
+        self.totals = np.empty(0, dtype=np.float32)
+        self.placings = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def extend(self, decklists: Iterable[Tuple[int, Optional[int], Dict[str, int]]]) -> "DecklistPartition":
+        """
+        New partition holding these (id, placing, cards) decklists after the
+        current ones; empty decklists are skipped.
+        """
+        partition = DecklistPartition()
+        partition.vocabulary = vocabulary = dict(self.vocabulary)
+        first_row = len(self.ids)
+        ids, placings, rows, columns, data = [], [], [], [], []
+        for decklist_id, placing, cards in decklists:
+            counts = [(key, count) for key, count in cards.items() if count > 0]
+            if not counts:
+                continue
+            for key, count in counts:
+                rows.append(first_row + len(ids))
+                columns.append(vocabulary.setdefault(key, len(vocabulary)))
+                data.append(count)
+            ids.append(decklist_id)
+            placings.append(_NO_PLACING if placing is None else placing)
+        if not ids:
+            return self
+
+        new_rows = np.asarray(rows, dtype=np.int32)
+        new_data = np.asarray(data, dtype=np.float32)
+        old_columns = np.repeat(
+            np.arange(len(self.colptr) - 1, dtype=np.int64), np.diff(self.colptr)
+        )
+        all_columns = np.concatenate([old_columns, np.asarray(columns, dtype=np.int64)])
+        order = np.argsort(all_columns, kind="stable")
+
+        partition.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+        partition.placings = np.concatenate([self.placings, np.asarray(placings, dtype=np.int32)])
+        partition.rows = np.concatenate([self.rows, new_rows])[order]
+        partition.data = np.concatenate([self.data, new_data])[order]
+        partition.colptr = np.concatenate([
+            [0], np.cumsum(np.bincount(all_columns, minlength=len(vocabulary)))
+        ]).astype(np.int64)
+
+        local_rows = new_rows - first_row
+        partition.norms = np.concatenate([
+            self.norms,
+            np.sqrt(np.bincount(local_rows, weights=new_data ** 2, minlength=len(ids))).astype(np.float32)
+        ])
+        partition.totals = np.concatenate([
+            self.totals,
+            np.bincount(local_rows, weights=new_data, minlength=len(ids)).astype(np.float32)
+        ])
+        return partition
+
+    def scores(self, cards: Dict[str, int], metric: str) -> np.ndarray:
+        """
+        Similarity of one query deck to every stored decklist. Cosine uses
+        card-count dot products; Jaccard is the weighted form, the sum of
+        per-card minimums over the sum of maximums. Query cards outside the
+        vocabulary never match but still count toward the query's norm.
+        """
+        counts = {key: count for key, count in cards.items() if count > 0}
+        query = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        query_norm = np.sqrt(np.sum(query ** 2))
+        query_total = np.sum(query)
+
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        # Each column holds a card's postings; a decklist appears at most once
+        # per column, so fancy-index accumulation needs no np.add.at
+        for key, count in counts.items():
+            column = self.vocabulary.get(key)
+            if column is None:
+                continue
+            start, end = self.colptr[column], self.colptr[column + 1]
+            rows = self.rows[start:end]
+            if metric == "jaccard":
+                scores[rows] += np.minimum(self.data[start:end], np.float32(count))
+            else:
+                scores[rows] += self.data[start:end] * np.float32(count)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if metric == "jaccard":
+                union = self.totals + query_total - scores
+                return np.where(union > 0, scores / union, 0).astype(np.float32)
+            denominator = self.norms * query_norm
+            return np.where(denominator > 0, scores / denominator, 0).astype(np.float32)
+
+    def top_k(
+        self,
+        decks: List[Dict[str, int]],
+        k: int,
+        metric: str,
+        max_placing: Optional[int] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        (decklist id, score) pairs of the k best matches for each query deck,
+        skipping zero scores and, with max_placing, lower finishes.
+        """
+        results = []
+        for cards in decks:
+            scores = self.scores(cards, metric)
+            if max_placing is not None:
+                scores[self.placings > max_placing] = 0
+            count = min(k, len(scores))
+            if count == 0:
+                results.append([])
+                continue
+            candidates = np.argpartition(-scores, count - 1)[:count]
+            ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+            ordered = ordered[scores[ordered] > 0]
+            results.append([(int(self.ids[c]), float(scores[c])) for c in ordered])
+        return results
+
+class DecklistSimilarityIndex:
+    """
+    In-memory similarity index over stored decklists, partitioned by
+    format and regulation mark. Loaded from the database at startup (or on
+    first use) and kept current by tournament ingest afterwards. Writers
+    build replacement partitions and swap them in under a lock; queries
+    only read the current partitions and never wait on it.
+    """
+    def __init__(self):
+        self.partitions: Dict[PartitionKey, DecklistPartition] = {}
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def _extended(
+        self,
+        decklists: Iterable[Tuple[int, str, Optional[str], Optional[int], Dict[str, int]]]
+    ) -> Dict[PartitionKey, DecklistPartition]:
+        grouped: Dict[PartitionKey, List[Tuple[int, Optional[int], Dict[str, int]]]] = {}
+        for decklist_id, format, regulation_mark, placing, cards in decklists:
+            grouped.setdefault(partition_key(format, regulation_mark), []).append(
+                (decklist_id, placing, cards)
+            )
+        partitions = dict(self.partitions)
+        for key, rows in grouped.items():
+            partition = partitions.get(key, DecklistPartition())
+            # A decklist committed while the index was loading may already be in it
+            known = np.isin([row[0] for row in rows], partition.ids)
+            partitions[key] = partition.extend(row for row, seen in zip(rows, known) if not seen)
+        return partitions
+
+    def add(self, decklists: List[Tuple[int, str, Optional[str], Optional[int], Dict[str, int]]]) -> None:
+        """Add newly stored (id, format, regulation mark, placing, cards) decklists; ignored until loaded."""
+        with self._lock:
+            if self.loaded:
+                self.partitions = self._extended(decklists)
+
+    def ensure_loaded(self, db: Session) -> None:
+        with self._lock:
+            if self.loaded:
+                return
+            rows = db.execute(
+                select(
+                    StoredDecklist.id,
+                    StoredDecklist.format,
+                    StoredDecklist.regulation_mark,
+                    StoredDecklist.placing,
+                    StoredDecklist.cards
+                ).execution_options(yield_per=10000)
+            )
+            self.partitions = self._extended(rows)
+            self.loaded = True
+
+    def load(self) -> None:
+        db = SessionLocal()
+        try:
+            self.ensure_loaded(db)
+        finally:
+            db.close()
+
+    async def start(self) -> None:
+        """Load the index when the application starts so no query pays for it."""
+        try:
+            await run_in_threadpool(self.load)
+            logging.info(f'Decklist similarity index loaded with {len(self.partitions)} partitions')
+        except Exception as e:
+            # The first similarity query retries the load
+            logging.error(f'Could not load decklist similarity index: {str(e)}')
+
+    def top_k(
+        self,
+        decks: List[Dict[str, int]],
+        format: str,
+        regulation_mark: Optional[str],
+        k: int,
+        metric: str = "cosine",
+        max_placing: Optional[int] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Best matches for each query deck within one regulation mark, or
+        across every mark of the format when regulation_mark is None,
+        optionally only among decklists placing max_placing or better.
+        """
+        if regulation_mark is None:
+            format = format.lower()
+            partitions = [
+                partition for key, partition in self.partitions.items() if key[0] == format
+            ]
+        else:
+            partition = self.partitions.get(partition_key(format, regulation_mark))
+            partitions = [partition] if partition is not None else []
+
+        if len(partitions) == 1:
+            return partitions[0].top_k(decks, k, metric, max_placing)
+        per_partition = [partition.top_k(decks, k, metric, max_placing) for partition in partitions]
+        return [
+            heapq.nlargest(
+                k,
+                (match for results in per_partition for match in results[i]),
+                key=lambda match: match[1]
+            )
+            for i in range(len(decks))
+        ]
+
+# Shared across requests so the matrices are built once per process
+decklist_index = DecklistSimilarityIndex()
+
+class SimilarityService:
+    """
+    Service for "find the most similar successful lists" queries used by
+    deck optimization.
+    """
+    def __init__(self, db: Session = Depends(get_db)):
+        self.db = db
+
+    def find_similar(self, request: SimilarDecksRequest, card_index: CardIndex) -> List[SimilarDeck]:
+        # Stored decklists are keyed by canonical card ids; key the query the same way
+        decklist = card_index.canonicalize(request.decklist)
+        cards = {key: count for key, count in decklist.card_counts().items() if count > 0}
+        if not cards:
+            raise HTTPException(status_code=422, detail="Decklist has no cards to compare")
+
+        try:
+            decklist_index.ensure_loaded(self.db)
+            matches = decklist_index.top_k(
+                [cards],
+                request.format,
+                request.regulation_mark,
+                request.k,
+                request.metric,
+                request.max_placing
+            )[0]
+            if not matches:
+                return []
+
+            records = {
+                record.id: record
+                for record in self.db.execute(
+                    select(StoredDecklist).where(
+                        StoredDecklist.id.in_([decklist_id for decklist_id, _ in matches])
+                    )
+                ).scalars()
+            }
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error searching similar decklists: {str(e)}")
+
+        return [
+            SimilarDeck(
+                decklist_id=decklist_id,
+                score=score,
+                tournament_id=records[decklist_id].tournament_id,
+                player_id=records[decklist_id].player_id,
+                archetype=records[decklist_id].archetype,
+                placing=records[decklist_id].placing,
+                cards=records[decklist_id].cards
+            )
+            for decklist_id, score in matches
+            if decklist_id in records
+        ]
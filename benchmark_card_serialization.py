@@ -0,0 +1,101 @@
+import json
+import sys
+import time
+from fastapi.encoders import jsonable_encoder
+from app.api.responses import CardListResponse, PayloadCache
+from app.models.card import Card
+
+def build_sample_card(index: int) -> Card:
+    """Build a fully populated card so every nested model is exercised."""
+    return Card(
+        id=f"sv3-{index}",
+        name=f"Charizard ex {index}",
+        supertype="Pokémon",
+        subtypes=["Stage 2", "ex", "Tera"],
+        number=str(index),
+        images={
+            "small": f"https://images.pokemontcg.io/sv3/{index}.png",
+            "large": f"https://images.pokemontcg.io/sv3/{index}_hires.png"
+        },
+        set={
+            "id": "sv3",
+            "name": "Obsidian Flames",
+            "series": "Scarlet & Violet",
+            "printedTotal": 197,
+            "total": 230,
+            "legalities": {"unlimited": "Legal", "standard": "Legal", "expanded": "Legal"},
+            "ptcgoCode": "OBF",
+            "releaseDate": "2023/08/11",
+            "updatedAt": "2023/08/11 15:00:00"
+        },
+        hp="330",
+        types=["Darkness"],
+        evolvesFrom="Charmeleon",
+        rules=["Pokémon ex rule: When your Pokémon ex is Knocked Out, your opponent takes 2 Prize cards."],
+        abilities=[{
+            "name": "Infernal Reign",
+            "text": "When you play this Pokémon from your hand to evolve 1 of your Pokémon during your turn, you may search your deck for up to 3 Basic Fire Energy cards and attach them to your Pokémon in any way you like. Then, shuffle your deck.",
+            "type": "Ability"
+        }],
+        attacks=[{
+            "name": "Burning Darkness",
+            "cost": ["Fire", "Fire"],
+            "convertedEnergyCost": 2,
+            "damage": "180+",
+            "text": "This attack does 30 more damage for each Prize card your opponent has taken."
+        }],
+        weaknesses=[{"type": "Grass", "value": "×2"}],
+        retreatCost=["Colorless", "Colorless"],
+        rarity="Double Rare",
+        legalities={"unlimited": "Legal", "standard": "Legal", "expanded": "Legal"},
+        regulationMark="G",
+        tcgplayer={
+            "url": f"https://prices.pokemontcg.io/tcgplayer/sv3-{index}",
+            "updatedAt": "2024/01/01",
+            "prices": {
+                "holofoil": {"low": 3.5, "mid": 5.0, "high": 20.0, "market": 4.8},
+                "reverseHolofoil": None
+            }
+        }
+    )
+
+def time_per_thousand(func, cards, repeats: int) -> float:
+    """Return the best observed milliseconds per 1,000 cards."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(cards)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 * (1000 / len(cards))
+
+def benchmark_card_serialization(card_count: int = 5000, repeats: int = 5):
+    """Compare FastAPI's default encoding path with the direct card list path."""
+    print(f"\nBuilding {card_count} sample cards...")
+    cards = [build_sample_card(i) for i in range(card_count)]
+
+    cache = PayloadCache(ttl_seconds=3600)
+    cache.set("bench", CardListResponse.serialize(cards))
+
+    # Sanity check: both paths must produce the same document
+    default_body = json.loads(json.dumps(jsonable_encoder(cards)))
+    fast_body = json.loads(CardListResponse.serialize(cards))
+    if default_body != fast_body:
+        print("\n❌ Serialized payloads differ between paths!")
+        sys.exit(1)
+
+    paths = [
+        ("jsonable_encoder + json.dumps", lambda c: json.dumps(jsonable_encoder(c)).encode("utf-8")),
+        ("TypeAdapter.dump_json", CardListResponse.serialize),
+        ("PayloadCache hit", lambda c: cache.get("bench")),
+    ]
+
+    print(f"\nSerialization cost per 1,000 cards (best of {repeats}):")
+    print("-" * 50)
+    baseline = None
+    for label, func in paths:
+        ms = max(time_per_thousand(func, cards, repeats), 1e-6)
+        baseline = baseline or ms
+        print(f"{label:<32} {ms:>8.2f} ms  ({baseline / ms:>6.1f}x)")
+
+if __name__ == "__main__":
+    benchmark_card_serialization()
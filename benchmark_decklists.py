@@ -0,0 +1,94 @@
+import sys
+import time
+import numpy as np
+from app.models.card import Card
+from app.services.decklist_service import CardIndex, DecklistParser
+from app.services.similarity_service import DecklistPartition
+
+def build_catalog(card_count: int) -> list:
+    """Catalog of distinct Trainers, each printed in two sets."""
+    cards = []
+    for index in range(card_count):
+        for code, set_id, release in (("SVI", "sv1", "2023/03/31"), ("PAL", "sv2", "2023/06/09")):
+            cards.append(Card(
+                id=f"{set_id}-{index}",
+                name=f"Trainer {index}",
+                supertype="Trainer",
+                subtypes=["Item"],
+                number=str(index),
+                images={"small": "", "large": ""},
+                set={
+                    "id": set_id,
+                    "name": set_id,
+                    "series": "Scarlet & Violet",
+                    "printedTotal": card_count,
+                    "total": card_count,
+                    "legalities": {},
+                    "ptcgoCode": code,
+                    "releaseDate": release,
+                    "updatedAt": ""
+                },
+                legalities={"standard": "Legal", "expanded": "Legal"},
+                regulationMark="G"
+            ))
+    return cards
+
+def build_export(rng: np.random.Generator, card_count: int) -> str:
+    """PTCGL-style export text with 20 distinct cards and section headers."""
+    picks = rng.choice(card_count, 20, replace=False)
+    codes = rng.choice(["SVI", "PAL"], 20)
+    lines = ["Trainer: 60"]
+    lines += [f"3 Trainer {card} {code} {card}" for card, code in zip(picks, codes)]
+    lines.append("Total Cards: 60")
+    return "\n".join(lines)
+
+def benchmark_parser(card_count: int = 2000, decklist_count: int = 20000):
+    rng = np.random.default_rng(0)
+    parser = DecklistParser(CardIndex(build_catalog(card_count)))
+    texts = [build_export(rng, card_count) for _ in range(decklist_count)]
+
+    start = time.perf_counter()
+    results = parser.parse_many(texts, format="standard")
+    elapsed = time.perf_counter() - start
+
+    # Sanity check: every line resolves and reprints merge to one id per card
+    if any(result.unresolved or result.decklist.total_cards != 60 for result in results):
+        print("\n❌ Parsed decklists do not match their exports!")
+        sys.exit(1)
+    print(f"\nParsed {decklist_count} decklists in {elapsed:.2f} s ({decklist_count / elapsed:,.0f} lists/s)")
+
+def benchmark_similarity(decklist_count: int = 200_000, vocabulary: int = 1500, queries: int = 50):
+    rng = np.random.default_rng(0)
+    decklists = []
+    for decklist_id in range(decklist_count):
+        keys = rng.choice(vocabulary, 20, replace=False)
+        counts = rng.integers(1, 5, size=20)
+        decklists.append((decklist_id, None, {f"card-{k}": int(c) for k, c in zip(keys, counts)}))
+
+    start = time.perf_counter()
+    partition = DecklistPartition().extend(decklists)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = partition.extend(decklists[:1000])
+    extend = time.perf_counter() - start
+
+    print(f"\nSimilarity index over {decklist_count:,} decklists:")
+    print("-" * 50)
+    print(f"{'initial build':<24} {build * 1000:>10.1f} ms")
+    print(f"{'extend by 1,000':<24} {extend * 1000:>10.1f} ms")
+    for metric in ("cosine", "jaccard"):
+        best = float("inf")
+        for query_id in range(queries):
+            start = time.perf_counter()
+            matches = batch.top_k([decklists[query_id][2]], 20, metric)[0]
+            best = min(best, time.perf_counter() - start)
+            # Sanity check: a stored decklist is its own best match
+            if matches[0][1] < 0.999:
+                print(f"\n❌ {metric} search did not return the query decklist first!")
+                sys.exit(1)
+        print(f"{metric + ' top-20 query':<24} {best * 1000:>10.2f} ms  (best of {queries})")
+
+if __name__ == "__main__":
+    benchmark_parser()
+    benchmark_similarity()
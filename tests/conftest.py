@@ -0,0 +1,82 @@
+# tests/conftest.py
+# Shared fixtures. The settings module refuses to import without these
+# variables; the tests only exercise pure logic and never connect to them.
+import os
+
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("POKEMON_TCG_API_KEY", "test")
+
+from typing import Dict, List, Optional
+import pytest
+from app.models.card import Card
+
+def make_card(
+    card_id: str,
+    name: str,
+    supertype: str = "Trainer",
+    ptcgo_code: Optional[str] = None,
+    number: str = "1",
+    release_date: str = "2023/03/31",
+    regulation_mark: Optional[str] = "G",
+    legalities: Optional[Dict[str, str]] = None,
+    hp: Optional[str] = None,
+    attacks: Optional[List[Dict]] = None
+) -> Card:
+    """Minimal catalog card; the set id is the part of card_id before the dash"""
+    set_id = card_id.split("-")[0]
+    return Card(
+        id=card_id,
+        name=name,
+        supertype=supertype,
+        subtypes=[],
+        number=number,
+        hp=hp,
+        attacks=attacks or [],
+        images={"small": "", "large": ""},
+        set={
+            "id": set_id,
+            "name": set_id,
+            "series": "Scarlet & Violet",
+            "printedTotal": 200,
+            "total": 200,
+            "legalities": {},
+            "ptcgoCode": ptcgo_code,
+            "releaseDate": release_date,
+            "updatedAt": ""
+        },
+        legalities=legalities if legalities is not None else {"standard": "Legal", "expanded": "Legal"},
+        regulationMark=regulation_mark
+    )
+
+@pytest.fixture
+def catalog() -> List[Card]:
+    """Small catalog with a reprinted Trainer, a reprinted Pokémon and basic Energy"""
+    attack = [{"name": "Burning Darkness", "cost": ["Fire", "Fire"], "convertedEnergyCost": 2,
+               "damage": "180+", "text": "Does more damage."}]
+    return [
+        make_card("sv1-196", "Iono", ptcgo_code="SVI", number="196", regulation_mark="G"),
+        make_card("sv2-185", "Iono", ptcgo_code="PAL", number="185",
+                  release_date="2023/06/09", regulation_mark="G"),
+        make_card("sv2-254", "Iono", ptcgo_code="PAL", number="254",
+                  release_date="2023/06/09", regulation_mark="G"),
+        make_card("sv3-125", "Charizard ex", supertype="Pokémon", ptcgo_code="OBF", number="125",
+                  release_date="2023/08/11", hp="330", attacks=attack),
+        make_card("sv3-223", "Charizard ex", supertype="Pokémon", ptcgo_code="OBF", number="223",
+                  release_date="2023/08/11", hp="330", attacks=attack),
+        make_card("swsh1-1", "Boss's Orders", ptcgo_code="RCL", number="154",
+                  release_date="2020/02/07", regulation_mark="D",
+                  legalities={"expanded": "Legal"}),
+        make_card("sv4-172", "Boss’s Orders", ptcgo_code="PAR", number="172",
+                  release_date="2023/11/03", regulation_mark="G"),
+        make_card("sve-2", "Basic Fire Energy", supertype="Energy", ptcgo_code="SVE", number="2",
+                  regulation_mark=None),
+        make_card("sm1-165", "Fire Energy", supertype="Energy", ptcgo_code="SUM", number="165",
+                  release_date="2017/02/03", regulation_mark=None,
+                  legalities={"expanded": "Legal"}),
+        make_card("sv1-181", "Nest Ball", ptcgo_code="SVI", number="181", regulation_mark="G"),
+        make_card("sv5-144", "Nest Ball", ptcgo_code="TEF", number="144",
+                  release_date="2024/03/22", regulation_mark="H"),
+        make_card("sv2-171", "Earthen Vessel", ptcgo_code="PAR", number="163",
+                  release_date="2023/11/03", regulation_mark="G"),
+    ]
@@ -0,0 +1,48 @@
+import json
+from math import comb
+import pytest
+from app.services.analytics_jobs import (
+    ConsistencyJob, ResultTooLargeError, execute_job, run_consistency
+)
+
+def deck(**counts):
+    return {"cards": [{"count": count, "name": key, "card_id": key} for key, count in counts.items()]}
+
+def miss_probability(deck_size, hits, seen):
+    """Hypergeometric chance of seeing none of `hits` cards among `seen` draws"""
+    return comb(deck_size - hits, seen) / comb(deck_size, seen)
+
+def test_consistency_matches_hypergeometric_rates():
+    job = ConsistencyJob(
+        decklist=deck(target=4, basic=10, other=46),
+        targets=["target"],
+        basics=["basic"],
+        draws=3,
+        trials=200_000,
+        seed=1
+    )
+    result = run_consistency(job)
+    assert result["deck_size"] == 60
+    expected = [1 - miss_probability(60, 4, 7 + extra) for extra in range(4)]
+    assert result["opening_hand_hit_rate"] == result["hit_rate_by_draw"][0]
+    assert result["hit_rate_by_draw"] == pytest.approx(expected, abs=0.005)
+    assert result["mulligan_rate"] == pytest.approx(miss_probability(60, 10, 7), abs=0.005)
+
+def test_consistency_is_reproducible_with_a_seed():
+    job = ConsistencyJob(decklist=deck(target=4, other=56), targets=["target"], trials=5000, seed=3)
+    assert run_consistency(job) == run_consistency(job)
+    assert run_consistency(job)["mulligan_rate"] is None
+
+def test_consistency_rejects_drawing_past_the_deck():
+    job = ConsistencyJob(decklist=deck(target=2, other=4), targets=["target"], trials=10)
+    with pytest.raises(ValueError):
+        run_consistency(job)
+
+def test_execute_job_encodes_and_limits_results():
+    payload = ConsistencyJob(
+        decklist=deck(target=4, other=56), targets=["target"], trials=1000, seed=1
+    ).model_dump(mode="json")
+    result = json.loads(execute_job("consistency", payload, timeout=30, max_result_bytes=10_000))
+    assert result["trials"] == 1000
+    with pytest.raises(ResultTooLargeError):
+        execute_job("consistency", payload, timeout=30, max_result_bytes=10)
@@ -0,0 +1,85 @@
+from app.models.deck import DeckCard, DeckList
+from app.services.decklist_service import CardIndex, DecklistParser, normalize_name
+from tests.conftest import make_card
+
+DECKLIST = """
+Pokémon: 4
+3 Charizard ex OBF 125
+1 Charizard ex OBF 223
+
+Trainer: 7
+2 Iono PAL 185
+2 Iono SVI 196
+3 Boss’s Orders
+
+Energy: 9
+* 5 Basic {R} Energy Energy 2
+4 Basic Fire Energy SVE 2
+
+Total Cards: 20
+"""
+
+def parse(catalog, text, **kwargs):
+    return DecklistParser(CardIndex(catalog)).parse(text, **kwargs)
+
+def test_normalize_name_folds_accents_quotes_and_spacing():
+    assert normalize_name("  Boss’s   Orders ") == "boss's orders"
+    assert normalize_name("Pokémon Catcher") == "pokemon catcher"
+
+def test_reprints_merge_into_canonical_printing(catalog):
+    result = parse(catalog, DECKLIST, format="standard", archetype="Charizard ex")
+    cards = {card.card_id: card for card in result.decklist.cards}
+    assert cards["sv3-223"].count == 4
+    assert cards["sv2-254"].count == 4
+    # Set and number come from the canonical printing, not the first line
+    assert (cards["sv2-254"].set, cards["sv2-254"].number) == ("PAL", "254")
+    assert cards["sv4-172"].count == 3
+    assert result.decklist.format == "standard"
+    assert result.decklist.archetype == "Charizard ex"
+
+def test_legacy_energy_lines_resolve(catalog):
+    result = parse(catalog, DECKLIST)
+    cards = {card.card_id: card for card in result.decklist.cards}
+    assert cards["sve-2"].count == 9
+    assert cards["sve-2"].name == "Basic Fire Energy"
+    assert result.unresolved == []
+
+def test_declared_counts_match(catalog):
+    result = parse(catalog, DECKLIST)
+    assert result.decklist.total_cards == 20
+    assert result.warnings == []
+
+def test_section_and_total_mismatches_warn(catalog):
+    result = parse(catalog, "Trainer (3):\n2 Iono PAL 185\nTotal Cards: 5\nsome stray text\n")
+    assert result.warnings == [
+        "Unrecognized line: some stray text",
+        "Trainer section declares 3 cards but lists 2",
+        "Total Cards declares 5 but list contains 2",
+    ]
+
+def test_unknown_cards_are_reported_and_kept(catalog):
+    result = parse(catalog, "2 Mystery Card XYZ 12\n1 Mystery Card XYZ 12\n")
+    assert result.unresolved == ["2 Mystery Card XYZ 12", "1 Mystery Card XYZ 12"]
+    assert result.decklist.cards == [DeckCard(count=3, name="Mystery Card", set="XYZ", number="12")]
+
+def test_collector_numbers_ignore_leading_zeros(catalog):
+    index = CardIndex(catalog)
+    assert index.resolve("Iono", "PAL", "0185") == "sv2-254"
+
+def test_names_shared_by_different_cards_do_not_resolve(catalog):
+    # Same name, different HP: two different cards, so the name alone is ambiguous
+    other = make_card("sv8-20", "Charizard ex", supertype="Pokémon", ptcgo_code="SSP", number="20",
+                      release_date="2024/11/08", hp="320")
+    index = CardIndex(catalog + [other])
+    assert index.resolve("Charizard ex", None, None) is None
+    assert index.resolve("Charizard ex", "OBF", "125") == "sv3-223"
+    assert index.resolve("Nest Ball", None, None) == "sv5-144"
+
+def test_canonicalize_resolves_ids_and_names(catalog):
+    index = CardIndex(catalog)
+    decklist = DeckList(cards=[
+        DeckCard(count=2, name="Iono", card_id="sv1-196"),
+        DeckCard(count=2, name="Iono", set="PAL", number="185"),
+        DeckCard(count=1, name="Unknown Card"),
+    ])
+    assert index.canonicalize(decklist).card_counts() == {"sv2-254": 4, "Unknown Card": 1}
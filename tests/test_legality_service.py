@@ -0,0 +1,50 @@
+from app.models.deck import DeckCard, DeckList
+from app.services.decklist_service import CardIndex
+from app.services.legality_service import LegalityIndex
+from tests.conftest import make_card
+
+def build_index(cards):
+    return LegalityIndex(cards, CardIndex(cards).canonical)
+
+def deck(*card_ids):
+    return DeckList(cards=[DeckCard(count=1, name=card_id, card_id=card_id) for card_id in card_ids])
+
+def test_reprint_rule_makes_every_printing_legal(catalog):
+    index = build_index(catalog)
+    # The Sword & Shield printing is Expanded-only, but its PAR reprint is Standard legal
+    assert index.is_legal("swsh1-1", "standard")
+    assert index.is_legal("sv4-172", "Standard")
+    assert not index.is_legal("sm1-165", "standard")
+    assert not index.is_legal("swsh1-1", "unlimited")
+
+def test_rotating_cards_keeps_groups_with_a_surviving_reprint(catalog):
+    index = build_index(catalog)
+    rotating = index.rotating_cards(["g"])
+    assert {"sv2-254", "sv1-196", "sv3-223", "sv4-172", "swsh1-1", "sv2-171"} <= rotating
+    # Nest Ball has an H reprint and basic Energy has no mark, so both stay
+    assert not rotating & {"sv1-181", "sv5-144", "sve-2", "sm1-165"}
+    assert index.rotating_cards(["G", "H"]) >= {"sv1-181", "sv5-144"}
+    assert index.rotating_cards([]) == frozenset()
+
+def test_check_decklist_reports_illegal_unknown_and_rotating(catalog):
+    cards = catalog + [make_card("swsh12-1", "Old Trainer", regulation_mark="F",
+                                 legalities={"expanded": "Legal"})]
+    index = build_index(cards)
+    result = index.check_decklist(deck("sv2-254", "sv5-144", "swsh12-1", "xy1-1"), "standard", ["G"])
+    assert not result.legal
+    assert result.illegal_cards == ["swsh12-1"]
+    assert result.unknown_cards == ["xy1-1"]
+    assert result.rotating_cards == ["sv2-254"]
+
+    expanded = index.check_decklist(deck("sv2-254", "swsh12-1"), "expanded", ["G"])
+    assert expanded.legal
+    assert expanded.rotating_cards == []
+
+def test_banned_card_is_illegal_not_unknown(catalog):
+    cards = catalog + [make_card("xy12-100", "Lysandre's Trump Card", regulation_mark=None,
+                                 legalities={"expanded": "Banned"})]
+    index = build_index(cards)
+    result = index.check_decklist(deck("xy12-100", "sv2-254"), "expanded", [])
+    assert not result.legal
+    assert result.illegal_cards == ["xy12-100"]
+    assert result.unknown_cards == []
@@ -0,0 +1,59 @@
+import math
+import numpy as np
+from app.models.tournament import Tournament
+from app.services.matchup_service import (
+    WIN, LOSS, TIE, count_matchups, matchup_rates, tournament_matchup_counts, wilson_interval
+)
+
+def test_count_matchups_counts_both_sides_of_distinct_archetypes():
+    counts = count_matchups(np.array([0, 1]), np.array([1, 0]), np.array([1, 0]), 2)
+    assert counts[WIN, 0, 1] == 1 and counts[LOSS, 1, 0] == 1
+    assert counts[TIE, 1, 0] == 1 and counts[TIE, 0, 1] == 1
+    assert np.array_equal(counts[WIN], counts[LOSS].T)
+
+def test_count_matchups_counts_mirror_once():
+    counts = count_matchups(np.array([0, 0, 0]), np.array([0, 0, 1]), np.array([1, -1, 0]), 2)
+    assert counts[:, 0, 0].tolist() == [1, 1, 0]
+    # Row sums are the real number of games each archetype played
+    assert counts.sum(axis=0).sum(axis=1).tolist() == [3, 1]
+
+def test_wilson_interval_matches_reference_values():
+    low, high = wilson_interval(np.array([5.0, 0.0, 10.0]), np.array([10, 10, 10]))
+    assert math.isclose(low[0], 0.2366, abs_tol=1e-4) and math.isclose(high[0], 0.7634, abs_tol=1e-4)
+    assert math.isclose(low[1], 0.0, abs_tol=1e-12) and 0 < high[1] < 0.35
+    assert 0.65 < low[2] and math.isclose(high[2], 1.0)
+
+def test_wilson_interval_is_nan_without_trials():
+    low, high = wilson_interval(np.array([0.0]), np.array([0]))
+    assert np.isnan(low[0]) and np.isnan(high[0])
+
+def test_matchup_rates_leave_mirror_cells_empty():
+    counts = count_matchups(np.array([0, 0, 0]), np.array([0, 0, 1]), np.array([1, 0, 1]), 2)
+    win_rate, ci_low, ci_high = matchup_rates(counts)
+    assert np.isnan(win_rate[0, 0]) and np.isnan(ci_low[0, 0]) and np.isnan(ci_high[0, 0])
+    assert win_rate[0, 1] == 1.0 and win_rate[1, 0] == 0.0
+    assert np.isnan(win_rate[1, 1])
+
+def test_tournament_matchup_counts_skips_byes_and_scores_ties():
+    tournament = Tournament(
+        id="t1",
+        name="Regional",
+        date="2024-05-04T09:00:00",
+        format="standard",
+        players=[
+            {"player_id": "p1", "name": "A", "archetype": "Charizard ex"},
+            {"player_id": "p2", "name": "B", "archetype": "Gardevoir ex"},
+            {"player_id": "p3", "name": "C"},
+        ],
+        pairings=[
+            {"round": 1, "player1": "p1", "player2": "p2", "winner": "p2"},
+            {"round": 1, "player1": "p3"},
+            {"round": 2, "player1": "p1", "player2": "p3"},
+        ]
+    )
+    archetypes, counts = tournament_matchup_counts(tournament)
+    index = {name: i for i, name in enumerate(archetypes)}
+    charizard, gardevoir, unknown = index["Charizard ex"], index["Gardevoir ex"], index["Unknown"]
+    assert counts[LOSS, charizard, gardevoir] == 1 and counts[WIN, gardevoir, charizard] == 1
+    assert counts[TIE, charizard, unknown] == 1 and counts[TIE, unknown, charizard] == 1
+    assert counts.sum() == 4
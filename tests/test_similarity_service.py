@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from app.services.similarity_service import DecklistPartition, DecklistSimilarityIndex
+
+def random_decklists(rng, count, vocabulary=60, cards_per_deck=15):
+    decklists = []
+    for decklist_id in range(count):
+        keys = rng.choice(vocabulary, cards_per_deck, replace=False)
+        decklists.append((decklist_id, int(rng.integers(1, 65)), {
+            f"card-{key}": int(rng.integers(1, 5)) for key in keys
+        }))
+    return decklists
+
+def brute_force(query, cards, metric):
+    keys = sorted(set(query) | set(cards))
+    a = np.array([query.get(key, 0) for key in keys], dtype=float)
+    b = np.array([cards.get(key, 0) for key in keys], dtype=float)
+    if metric == "jaccard":
+        return np.minimum(a, b).sum() / np.maximum(a, b).sum()
+    return a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+
+@pytest.mark.parametrize("metric", ["cosine", "jaccard"])
+def test_scores_match_brute_force(metric):
+    rng = np.random.default_rng(7)
+    decklists = random_decklists(rng, 300)
+    # Built in several batches, the way ingest extends a partition
+    partition = DecklistPartition()
+    for start in range(0, 300, 70):
+        partition = partition.extend(decklists[start:start + 70])
+
+    query = {"card-1": 4, "card-2": 2, "card-3": 1, "not-in-vocabulary": 3}
+    scores = partition.scores(query, metric)
+    expected = [brute_force(query, cards, metric) for _, _, cards in decklists]
+    assert partition.ids.tolist() == list(range(300))
+    np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+
+def test_extend_leaves_the_original_partition_untouched():
+    partition = DecklistPartition().extend([(1, None, {"a": 4})])
+    extended = partition.extend([(2, None, {"b": 4}), (3, None, {"a": 0})])
+    assert partition.ids.tolist() == [1] and partition.vocabulary == {"a": 0}
+    # Empty decklists are skipped
+    assert extended.ids.tolist() == [1, 2]
+
+def test_top_k_orders_by_score_and_drops_zero_scores():
+    partition = DecklistPartition().extend([
+        (1, 1, {"a": 4}),
+        (2, 2, {"a": 2, "b": 2}),
+        (3, 3, {"c": 4}),
+    ])
+    matches = partition.top_k([{"a": 4}], k=3, metric="cosine")[0]
+    assert [decklist_id for decklist_id, _ in matches] == [1, 2]
+    assert matches[0][1] == pytest.approx(1.0)
+
+def test_top_k_max_placing_filter():
+    partition = DecklistPartition().extend([(1, 40, {"a": 4}), (2, 8, {"a": 3}), (3, None, {"a": 4})])
+    assert partition.top_k([{"a": 4}], k=3, metric="cosine", max_placing=8) == [[(2, pytest.approx(1.0))]]
+
+def test_index_searches_every_mark_without_one():
+    index = DecklistSimilarityIndex()
+    index.loaded = True
+    index.add([
+        (1, "Standard", "G", 1, {"a": 4}),
+        (2, "standard", "H", 1, {"a": 2, "b": 2}),
+        (3, "expanded", None, 1, {"a": 4}),
+    ])
+    assert [match[0] for match in index.top_k([{"a": 4}], "standard", None, k=5)[0]] == [1, 2]
+    assert [match[0] for match in index.top_k([{"a": 4}], "standard", "h", k=5)[0]] == [2]
+    assert index.top_k([{"a": 4}], "standard", "F", k=5) == [[]]
+
+def test_index_ignores_decklists_it_already_holds():
+    index = DecklistSimilarityIndex()
+    index.loaded = True
+    index.add([(1, "standard", "G", 1, {"a": 4})])
+    index.add([(1, "standard", "G", 1, {"a": 4}), (2, "standard", "G", 2, {"a": 4})])
+    assert index.partitions[("standard", "G")].ids.tolist() == [1, 2]